@@ -1,9 +1,13 @@
+import functools
 import logging
+import queue
+import re
 import sys
 import threading
 import time
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType, SimpleNamespace
 
-import pyperclip
 import requests
 
 from translator import translate
@@ -13,6 +17,9 @@ log = logging.getLogger(__name__)
 
 _IS_WINDOWS = sys.platform == "win32"
 
+# Legacy scan-code hotkey token, e.g. "sc20" (saved by the old recorder).
+_SC_TOKEN_RE = re.compile(r"sc(\d+)")
+
 # ---------------------------------------------------------------------------
 # Windows RegisterHotKey via ctypes — with explicit function signatures
 # ---------------------------------------------------------------------------
@@ -32,24 +39,78 @@ if _IS_WINDOWS:
     _user32.UnregisterHotKey.argtypes = [ctypes.wintypes.HWND, ctypes.c_int]
     _user32.UnregisterHotKey.restype = ctypes.wintypes.BOOL
 
-    # GetMessageW (blocking)
-    _user32.GetMessageW.argtypes = [
+    # MsgWaitForMultipleObjects (blocks until a hotkey arrives or the stop event is set)
+    _user32.MsgWaitForMultipleObjects.argtypes = [
+        ctypes.wintypes.DWORD,
+        ctypes.POINTER(ctypes.wintypes.HANDLE),
+        ctypes.wintypes.BOOL,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.DWORD,
+    ]
+    _user32.MsgWaitForMultipleObjects.restype = ctypes.wintypes.DWORD
+
+    # PeekMessageW (non-blocking drain of queued WM_HOTKEY messages)
+    _user32.PeekMessageW.argtypes = [
         ctypes.POINTER(ctypes.wintypes.MSG),
         ctypes.wintypes.HWND,
         ctypes.wintypes.UINT,
         ctypes.wintypes.UINT,
+        ctypes.wintypes.UINT,
     ]
-    _user32.GetMessageW.restype = ctypes.wintypes.BOOL
+    _user32.PeekMessageW.restype = ctypes.wintypes.BOOL
 
-    # PostThreadMessageW (to unblock GetMessageW from another thread)
-    _user32.PostThreadMessageW.argtypes = [
-        ctypes.wintypes.DWORD, ctypes.wintypes.UINT,
-        ctypes.wintypes.WPARAM, ctypes.wintypes.LPARAM,
+    # Manual-reset event used to stop the hotkey thread
+    _kernel32.CreateEventW.argtypes = [
+        ctypes.wintypes.LPVOID, ctypes.wintypes.BOOL, ctypes.wintypes.BOOL, ctypes.wintypes.LPCWSTR,
     ]
-    _user32.PostThreadMessageW.restype = ctypes.wintypes.BOOL
-
-    _kernel32.GetCurrentThreadId.argtypes = []
-    _kernel32.GetCurrentThreadId.restype = ctypes.wintypes.DWORD
+    _kernel32.CreateEventW.restype = ctypes.wintypes.HANDLE
+    _kernel32.SetEvent.argtypes = [ctypes.wintypes.HANDLE]
+    _kernel32.SetEvent.restype = ctypes.wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+
+    # Thread priority / power throttling for the hotkey thread
+    _kernel32.GetCurrentThread.argtypes = []
+    _kernel32.GetCurrentThread.restype = ctypes.wintypes.HANDLE
+    _kernel32.SetThreadPriority.argtypes = [ctypes.wintypes.HANDLE, ctypes.c_int]
+    _kernel32.SetThreadPriority.restype = ctypes.wintypes.BOOL
+
+    # Clipboard (CF_UNICODETEXT read/write without pyperclip)
+    _user32.OpenClipboard.argtypes = [ctypes.wintypes.HWND]
+    _user32.OpenClipboard.restype = ctypes.wintypes.BOOL
+    _user32.CloseClipboard.argtypes = []
+    _user32.CloseClipboard.restype = ctypes.wintypes.BOOL
+    _user32.EmptyClipboard.argtypes = []
+    _user32.EmptyClipboard.restype = ctypes.wintypes.BOOL
+    _user32.GetClipboardData.argtypes = [ctypes.wintypes.UINT]
+    _user32.GetClipboardData.restype = ctypes.wintypes.HANDLE
+    _user32.SetClipboardData.argtypes = [ctypes.wintypes.UINT, ctypes.wintypes.HANDLE]
+    _user32.SetClipboardData.restype = ctypes.wintypes.HANDLE
+    _user32.GetClipboardSequenceNumber.argtypes = []
+    _user32.GetClipboardSequenceNumber.restype = ctypes.wintypes.DWORD
+
+    # Message-only window that owns the clipboard while we write it
+    _user32.CreateWindowExW.argtypes = [
+        ctypes.wintypes.DWORD, ctypes.wintypes.LPCWSTR, ctypes.wintypes.LPCWSTR, ctypes.wintypes.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.wintypes.HWND, ctypes.wintypes.HMENU, ctypes.wintypes.HINSTANCE, ctypes.wintypes.LPVOID,
+    ]
+    _user32.CreateWindowExW.restype = ctypes.wintypes.HWND
+    _user32.DestroyWindow.argtypes = [ctypes.wintypes.HWND]
+    _user32.DestroyWindow.restype = ctypes.wintypes.BOOL
+
+    _kernel32.GlobalAlloc.argtypes = [ctypes.wintypes.UINT, ctypes.c_size_t]
+    _kernel32.GlobalAlloc.restype = ctypes.wintypes.HGLOBAL
+    _kernel32.GlobalLock.argtypes = [ctypes.wintypes.HGLOBAL]
+    _kernel32.GlobalLock.restype = ctypes.wintypes.LPVOID
+    _kernel32.GlobalUnlock.argtypes = [ctypes.wintypes.HGLOBAL]
+    _kernel32.GlobalUnlock.restype = ctypes.wintypes.BOOL
+    _kernel32.GlobalFree.argtypes = [ctypes.wintypes.HGLOBAL]
+    _kernel32.GlobalFree.restype = ctypes.wintypes.HGLOBAL
+
+    CF_UNICODETEXT = 13
+    HWND_MESSAGE = ctypes.wintypes.HWND(-3)
+    GMEM_MOVEABLE = 0x0002
 
     MOD_ALT = 0x0001
     MOD_CONTROL = 0x0002
@@ -58,24 +119,61 @@ if _IS_WINDOWS:
     MOD_NOREPEAT = 0x4000
 
     WM_HOTKEY = 0x0312
-    WM_QUIT = 0x0012
+    PM_REMOVE = 0x0001
+    QS_HOTKEY = 0x0080
+    INFINITE = 0xFFFFFFFF
+    WAIT_OBJECT_0 = 0x00000000
+
+    THREAD_PRIORITY_ABOVE_NORMAL = 1
+    _THREAD_POWER_THROTTLING = 3  # THREAD_INFORMATION_CLASS.ThreadPowerThrottling
+    THREAD_POWER_THROTTLING_CURRENT_VERSION = 1
+    THREAD_POWER_THROTTLING_EXECUTION_SPEED = 0x1
+
+    class _THREAD_POWER_THROTTLING_STATE(ctypes.Structure):
+        _fields_ = [
+            ("Version", ctypes.wintypes.ULONG),
+            ("ControlMask", ctypes.wintypes.ULONG),
+            ("StateMask", ctypes.wintypes.ULONG),
+        ]
+
+    def _mark_thread_latency_sensitive() -> None:
+        """Raise the calling thread's priority and opt it out of EcoQoS throttling."""
+        h = _kernel32.GetCurrentThread()
+        if not _kernel32.SetThreadPriority(h, THREAD_PRIORITY_ABOVE_NORMAL):
+            log.debug("SetThreadPriority failed (WinError %d).", ctypes.GetLastError())
+
+        # SetThreadInformation exists on Windows 8+ only.
+        set_info = getattr(_kernel32, "SetThreadInformation", None)
+        if set_info is None:
+            return
+        set_info.argtypes = [
+            ctypes.wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, ctypes.wintypes.DWORD,
+        ]
+        set_info.restype = ctypes.wintypes.BOOL
+        # ControlMask set + StateMask clear = "never throttle execution speed".
+        state = _THREAD_POWER_THROTTLING_STATE(
+            THREAD_POWER_THROTTLING_CURRENT_VERSION, THREAD_POWER_THROTTLING_EXECUTION_SPEED, 0,
+        )
+        if not set_info(h, _THREAD_POWER_THROTTLING, ctypes.byref(state), ctypes.sizeof(state)):
+            log.debug("SetThreadInformation failed (WinError %d).", ctypes.GetLastError())
 
     _HOTKEY_ID_FORWARD = 1
     _HOTKEY_ID_BACKWARD = 2
 
-    # Virtual-key codes for A-Z and digits (layout-independent!)
-    _VK_MAP: dict[str, int] = {}
-    for _i, _ch in enumerate("abcdefghijklmnopqrstuvwxyz"):
-        _VK_MAP[_ch] = 0x41 + _i
-    for _i in range(10):
-        _VK_MAP[str(_i)] = 0x30 + _i
-    _VK_MAP.update({
-        "space": 0x20, "enter": 0x0D, "return": 0x0D, "tab": 0x09,
-        "escape": 0x1B, "esc": 0x1B,
-        "f1": 0x70, "f2": 0x71, "f3": 0x72, "f4": 0x73,
-        "f5": 0x74, "f6": 0x75, "f7": 0x76, "f8": 0x77,
-        "f9": 0x78, "f10": 0x79, "f11": 0x7A, "f12": 0x7B,
-    })
+    def _build_vk_map() -> Mapping[str, int]:
+        """Virtual-key codes for A-Z, digits and named keys (layout-independent!)."""
+        vk_map = {ch: 0x41 + i for i, ch in enumerate("abcdefghijklmnopqrstuvwxyz")}
+        vk_map.update({str(i): 0x30 + i for i in range(10)})
+        vk_map.update({
+            "space": 0x20, "enter": 0x0D, "return": 0x0D, "tab": 0x09,
+            "escape": 0x1B, "esc": 0x1B,
+            "f1": 0x70, "f2": 0x71, "f3": 0x72, "f4": 0x73,
+            "f5": 0x74, "f6": 0x75, "f7": 0x76, "f8": 0x77,
+            "f9": 0x78, "f10": 0x79, "f11": 0x7A, "f12": 0x7B,
+        })
+        return MappingProxyType(vk_map)
+
+    _VK_MAP: Mapping[str, int] = _build_vk_map()
 
     _MOD_NAMES: dict[str, int] = {
         "ctrl": MOD_CONTROL, "control": MOD_CONTROL,
@@ -139,6 +237,12 @@ if _IS_WINDOWS:
         91: MOD_WIN, 92: MOD_WIN,            # Left/Right Win
     }
 
+    # Flat lookup tables indexed by scan code (0 = no mapping); built once from the dicts above.
+    _SC_LUT_SIZE = 512
+    _SC_TO_VK_LUT = bytes(_SC_TO_VK.get(i, 0) for i in range(_SC_LUT_SIZE))
+    _SC_TO_MOD_LUT = bytes(_SC_TO_MOD.get(i, 0) for i in range(_SC_LUT_SIZE))
+
+    @functools.lru_cache(maxsize=16)
     def _parse_hotkey_string(hotkey: str) -> tuple[int, int]:
         """Parse 'ctrl+alt+t' → (modifier_flags, vk_code).
 
@@ -153,13 +257,15 @@ if _IS_WINDOWS:
                 modifiers |= _MOD_NAMES[p]
             elif p in _VK_MAP:
                 vk = _VK_MAP[p]
-            elif p.startswith("sc") and p[2:].isdigit():
+            elif m := _SC_TOKEN_RE.fullmatch(p):
                 # Legacy scan-code format: "sc20" → scan code 20 → VK_T
-                sc = int(p[2:])
-                if sc in _SC_TO_MOD:
-                    modifiers |= _SC_TO_MOD[sc]
-                elif sc in _SC_TO_VK:
-                    vk = _SC_TO_VK[sc]
+                sc = int(m.group(1))
+                mod = _SC_TO_MOD_LUT[sc] if sc < _SC_LUT_SIZE else 0
+                sc_vk = _SC_TO_VK_LUT[sc] if sc < _SC_LUT_SIZE else 0
+                if mod:
+                    modifiers |= mod
+                elif sc_vk:
+                    vk = sc_vk
                 else:
                     log.warning("Unknown scan code in hotkey: %r (sc=%d)", p, sc)
             else:
@@ -171,6 +277,7 @@ if _IS_WINDOWS:
 # Linux/macOS — pynput-based hotkey detection and key simulation
 # ---------------------------------------------------------------------------
 if not _IS_WINDOWS:
+    import pyperclip
     from pynput.keyboard import (
         Controller as _PynputController,
         GlobalHotKeys as _PynputGlobalHotKeys,
@@ -215,8 +322,8 @@ if not _IS_WINDOWS:
         for p in parts:
             if p in _PYNPUT_FORMAT_MAP:
                 result.append(_PYNPUT_FORMAT_MAP[p])
-            elif p.startswith("sc") and p[2:].isdigit():
-                sc = int(p[2:])
+            elif m := _SC_TOKEN_RE.fullmatch(p):
+                sc = int(m.group(1))
                 name = _PYNPUT_SC_TO_NAME.get(sc)
                 if name and name in _PYNPUT_FORMAT_MAP:
                     result.append(_PYNPUT_FORMAT_MAP[name])
@@ -234,6 +341,17 @@ if not _IS_WINDOWS:
         return fmt
 
 
+def _run_config(settings: dict) -> SimpleNamespace:
+    """Snapshot the settings read by the translate flow on every hotkey press."""
+    return SimpleNamespace(
+        base_url=settings.get("base_url", ""),
+        model=settings.get("model", ""),
+        source_lang=settings.get("source_lang", ""),
+        target_lang=settings.get("target_lang", ""),
+        is_ollama=settings.get("active_profile") == "Ollama",
+    )
+
+
 class HotkeyHandler:
     """Manages global hotkey registration and the copy-translate-paste flow."""
 
@@ -245,29 +363,46 @@ class HotkeyHandler:
         on_busy_end=None,
         on_overlay_message=None,
         on_overlay_progress=None,
-        on_overlay_detail=None,
         on_download_progress=None,
+        on_stream_start=None,
     ):
         self._settings = dict(settings)
+        self._rc = _run_config(self._settings)
         self._on_error = on_error
         self._on_busy_start = on_busy_start
         self._on_busy_end = on_busy_end
         self._on_overlay_message = on_overlay_message
         self._on_overlay_progress = on_overlay_progress
-        self._on_overlay_detail = on_overlay_detail  # callback(str) for streaming partials
+        # Throttled streaming-partial detail strings; the UI drains them via drain_partial().
+        self._partial_q: queue.SimpleQueue[str] = queue.SimpleQueue()
         self._on_download_progress = on_download_progress
-        self._run_lock = threading.Lock()
+        self._on_stream_start = on_stream_start
+        # One translate/download/unload at a time. Set on the triggering
+        # thread, cleared by the worker; _busy_guard makes test-and-set atomic
+        # across the hotkey, tray and download threads.
+        self._busy = threading.Event()
+        self._busy_guard = threading.Lock()
+        # Deferred restore of the user's clipboard after a paste (see _translate_flow).
+        self._restore_lock = threading.Lock()
+        self._restore_timer: threading.Timer | None = None
+        self._restore_pending: str | None = None
+        # (base_url, installed Ollama models) — warmed in the background so the
+        # hotkey path can skip the /api/tags round-trip.
+        self._known_models: tuple[str, frozenset[str]] = ("", frozenset())
 
         if _IS_WINDOWS:
             # Windows hotkey thread state
             self._winhk_thread: threading.Thread | None = None
-            self._winhk_thread_id: int | None = None
-            # _winhk_registered is set once the hotkey thread finishes its RegisterHotKey call.
-            self._winhk_registered = threading.Event()
+            # Kernel event signalled by unregister() to stop the hotkey thread.
+            self._winhk_stop_event: int | None = None
+            # Parsed (fwd, bwd) hotkeys currently held by the thread; None if any registration failed.
+            self._winhk_keys: tuple[tuple[int, int], tuple[int, int]] | None = None
         else:
             # Linux/macOS pynput listener
             self._pynput_listener = None
 
+        self._warm_known_models()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -275,15 +410,21 @@ class HotkeyHandler:
     def update_settings(self, settings: dict) -> None:
         """Apply new settings and re-register the hotkey."""
         self._settings = dict(settings)
+        self._rc = _run_config(self._settings)
+        self._warm_known_models()
         self.register()
 
     def register(self) -> None:
         """(Re-)register the global hotkeys using the platform-appropriate mechanism."""
-        self.unregister()
-
         hotkey_str = self._settings.get("hotkey", "ctrl+alt+t")
         backward_hotkey_str = self._settings.get("backward_hotkey", "ctrl+alt+y")
 
+        if _IS_WINDOWS and self._windows_hotkeys_unchanged(hotkey_str, backward_hotkey_str):
+            log.debug("Hotkeys unchanged — keeping the existing registration.")
+            return
+
+        self.unregister()
+
         if _IS_WINDOWS:
             self._register_windows(hotkey_str, backward_hotkey_str)
         else:
@@ -296,9 +437,29 @@ class HotkeyHandler:
         else:
             self._unregister_linux()
 
+    def _try_begin_run(self) -> bool:
+        with self._busy_guard:
+            if self._busy.is_set():
+                return False
+            self._busy.set()
+        return True
+
+    def _end_run(self) -> None:
+        self._busy.clear()
+
+    def drain_partial(self) -> str | None:
+        """Return the newest queued streaming detail (discarding older ones), or None."""
+        latest = None
+        try:
+            while True:
+                latest = self._partial_q.get_nowait()
+        except queue.Empty:
+            pass
+        return latest
+
     def download_model_async(self, base_url: str, model: str) -> None:
         """Download (pull) an Ollama model in a background thread."""
-        if not self._run_lock.acquire(blocking=False):
+        if not self._try_begin_run():
             return
         threading.Thread(
             target=self._download_worker,
@@ -307,13 +468,13 @@ class HotkeyHandler:
         ).start()
 
     def _is_ollama_profile(self) -> bool:
-        return self._settings.get("active_profile") == "Ollama"
+        return self._rc.is_ollama
 
     def unload_ollama_models_sync(self) -> None:
         """Unload all running Ollama models from memory (best-effort)."""
         if not self._is_ollama_profile():
             return
-        if not self._run_lock.acquire(blocking=False):
+        if not self._try_begin_run():
             return
         try:
             if self._on_busy_start:
@@ -324,7 +485,7 @@ class HotkeyHandler:
                 self._on_overlay_progress(None)
             self._notify_download(True, "Unloading models from memory...", None)
 
-            base_url = self._settings.get("base_url", "")
+            base_url = self._rc.base_url
             attempted = unload_all_running_models(base_url)
 
             msg = "Unloaded models." if attempted else "No running models."
@@ -338,10 +499,7 @@ class HotkeyHandler:
         finally:
             if self._on_busy_end:
                 self._on_busy_end()
-            try:
-                self._run_lock.release()
-            except RuntimeError:
-                pass
+            self._end_run()
 
     def unload_ollama_models_async(self) -> None:
         """Unload all running Ollama models from memory in a background thread."""
@@ -360,7 +518,18 @@ class HotkeyHandler:
             self._on_overlay_progress(None)
         self._notify_download(True, f"Downloading model: {model}", None)
 
+        last_emit_ns = 0
+        last_status = ""
+
         def on_progress(status: str, percent: int | None) -> None:
+            nonlocal last_emit_ns, last_status
+            # Coalesce to ~15 Hz; always pass through status changes and 100%.
+            now = time.monotonic_ns()
+            if now - last_emit_ns < 66_000_000 and percent != 100 and status == last_status:
+                return
+            last_emit_ns = now
+            last_status = status
+
             if self._on_overlay_message:
                 self._on_overlay_message(status)
             if self._on_overlay_progress:
@@ -385,16 +554,38 @@ class HotkeyHandler:
         finally:
             if self._on_busy_end:
                 self._on_busy_end()
-            try:
-                self._run_lock.release()
-            except RuntimeError:
-                pass
+            self._end_run()
+
+    def _warm_known_models(self) -> None:
+        if not self._rc.is_ollama:
+            return
+        threading.Thread(
+            target=self._warm_known_models_worker,
+            args=(self._rc.base_url,),
+            daemon=True,
+        ).start()
 
-    def _ensure_ollama_model(self, base_url: str, model: str) -> None:
-        models = list_models(base_url)
+    def _warm_known_models_worker(self, base_url: str) -> None:
+        try:
+            self._refresh_known_models(base_url)
+        except Exception as exc:
+            log.debug("Could not pre-fetch Ollama models: %s", exc)
+
+    def _refresh_known_models(self, base_url: str) -> frozenset[str]:
+        # Always ask the server: this set is the handler's own cache.
+        models = frozenset(list_models(base_url, max_age=0))
+        self._known_models = (base_url, models)
+        return models
+
+    def _ensure_ollama_model(self, base_url: str, model: str, use_cache: bool = True) -> None:
+        known_url, known = self._known_models
+        if use_cache and known_url == base_url and model in known:
+            return
+        models = self._refresh_known_models(base_url)
         if model in models:
             return
         self._pull_model_with_progress(base_url, model)
+        self._known_models = (base_url, models | {model})
 
     def _is_model_not_found_error(self, exc: Exception, model: str) -> bool:
         if not isinstance(exc, requests.HTTPError) or exc.response is None:
@@ -416,6 +607,17 @@ class HotkeyHandler:
     # ------------------------------------------------------------------
 
     if _IS_WINDOWS:
+        def _windows_hotkeys_unchanged(self, hotkey_str: str, backward_hotkey_str: str) -> bool:
+            return (
+                self._winhk_keys is not None
+                and self._winhk_thread is not None
+                and self._winhk_thread.is_alive()
+                and self._winhk_keys == (
+                    _parse_hotkey_string(hotkey_str),
+                    _parse_hotkey_string(backward_hotkey_str),
+                )
+            )
+
         def _register_windows(self, hotkey_str: str, backward_hotkey_str: str) -> None:
             fwd_mod, fwd_vk = _parse_hotkey_string(hotkey_str)
             bwd_mod, bwd_vk = _parse_hotkey_string(backward_hotkey_str)
@@ -433,62 +635,94 @@ class HotkeyHandler:
             if not fwd_vk and not bwd_vk:
                 return
 
-            self._winhk_registered = threading.Event()
-
-            def _thread_func() -> None:
-                tid = _kernel32.GetCurrentThreadId()
-                self._winhk_thread_id = tid
-
-                if fwd_vk:
-                    log.info("Registering forward hotkey mod=0x%04X vk=0x%04X", fwd_mod, fwd_vk)
-                    ok = _user32.RegisterHotKey(None, _HOTKEY_ID_FORWARD, fwd_mod | MOD_NOREPEAT, fwd_vk)
-                    if not ok:
-                        err = ctypes.GetLastError()
-                        log.error("RegisterHotKey (forward) failed (WinError %d).", err)
-
-                if bwd_vk:
-                    log.info("Registering backward hotkey mod=0x%04X vk=0x%04X", bwd_mod, bwd_vk)
-                    ok = _user32.RegisterHotKey(None, _HOTKEY_ID_BACKWARD, bwd_mod | MOD_NOREPEAT, bwd_vk)
-                    if not ok:
-                        err = ctypes.GetLastError()
-                        log.error("RegisterHotKey (backward) failed (WinError %d).", err)
-
-                self._winhk_registered.set()
-
-                msg = ctypes.wintypes.MSG()
-                while True:
-                    ret = _user32.GetMessageW(ctypes.byref(msg), None, 0, 0)
-                    if ret <= 0:
-                        log.info("Hotkey message loop exiting (GetMessageW returned %d).", ret)
-                        break
-                    if msg.message == WM_HOTKEY:
-                        if msg.wParam == _HOTKEY_ID_FORWARD:
-                            log.debug("WM_HOTKEY (forward) received.")
-                            self._on_hotkey()
-                        elif msg.wParam == _HOTKEY_ID_BACKWARD:
-                            log.debug("WM_HOTKEY (backward) received.")
-                            self._on_backward_hotkey()
-
-                _user32.UnregisterHotKey(None, _HOTKEY_ID_FORWARD)
-                _user32.UnregisterHotKey(None, _HOTKEY_ID_BACKWARD)
-                log.info("UnregisterHotKey done (both forward and backward).")
+            stop_event = _kernel32.CreateEventW(None, True, False, None)
+            if not stop_event:
+                err_msg = f"CreateEventW failed (WinError {ctypes.GetLastError()})."
+                log.error(err_msg)
+                if self._on_error:
+                    self._on_error(err_msg)
+                return
+            self._winhk_stop_event = stop_event
 
             self._winhk_thread = threading.Thread(
-                target=_thread_func, daemon=True
+                target=self._pump_thread,
+                args=(stop_event, (fwd_mod, fwd_vk), (bwd_mod, bwd_vk)),
+                daemon=True,
             )
             self._winhk_thread.start()
-            self._winhk_registered.wait(timeout=3)
+
+        def _pump_thread(
+            self,
+            stop_event: int,
+            fwd: tuple[int, int],
+            bwd: tuple[int, int],
+        ) -> None:
+            """Register the hotkeys on this thread and dispatch WM_HOTKEY until *stop_event* is set."""
+            fwd_mod, fwd_vk = fwd
+            bwd_mod, bwd_vk = bwd
+
+            _mark_thread_latency_sensitive()
+            all_ok = True
+
+            if fwd_vk:
+                log.info("Registering forward hotkey mod=0x%04X vk=0x%04X", fwd_mod, fwd_vk)
+                ok = _user32.RegisterHotKey(None, _HOTKEY_ID_FORWARD, fwd_mod | MOD_NOREPEAT, fwd_vk)
+                if not ok:
+                    err = ctypes.GetLastError()
+                    log.error("RegisterHotKey (forward) failed (WinError %d).", err)
+                    all_ok = False
+
+            if bwd_vk:
+                log.info("Registering backward hotkey mod=0x%04X vk=0x%04X", bwd_mod, bwd_vk)
+                ok = _user32.RegisterHotKey(None, _HOTKEY_ID_BACKWARD, bwd_mod | MOD_NOREPEAT, bwd_vk)
+                if not ok:
+                    err = ctypes.GetLastError()
+                    log.error("RegisterHotKey (backward) failed (WinError %d).", err)
+                    all_ok = False
+
+            if all_ok:
+                self._winhk_keys = ((fwd_mod, fwd_vk), (bwd_mod, bwd_vk))
+
+            msg = ctypes.wintypes.MSG()
+            msg_ref = ctypes.byref(msg)
+            handles = (ctypes.wintypes.HANDLE * 1)(stop_event)
+            msg_wait = _user32.MsgWaitForMultipleObjects
+            peek_message = _user32.PeekMessageW
+            while True:
+                # Wake only for the stop event or queued hotkeys (QS_HOTKEY).
+                # windll calls drop the GIL, so the thread stays parked in the
+                # kernel here and the interpreter never schedules it meanwhile.
+                ret = msg_wait(1, handles, False, INFINITE, QS_HOTKEY)
+                if ret == WAIT_OBJECT_0:
+                    log.info("Hotkey message loop exiting (stop event set).")
+                    break
+                if ret != WAIT_OBJECT_0 + 1:
+                    log.error("MsgWaitForMultipleObjects failed (WinError %d).", ctypes.GetLastError())
+                    break
+                while peek_message(msg_ref, None, WM_HOTKEY, WM_HOTKEY, PM_REMOVE):
+                    if msg.wParam == _HOTKEY_ID_FORWARD:
+                        log.debug("WM_HOTKEY (forward) received.")
+                        self._on_hotkey()
+                    elif msg.wParam == _HOTKEY_ID_BACKWARD:
+                        log.debug("WM_HOTKEY (backward) received.")
+                        self._on_backward_hotkey()
+
+            _user32.UnregisterHotKey(None, _HOTKEY_ID_FORWARD)
+            _user32.UnregisterHotKey(None, _HOTKEY_ID_BACKWARD)
+            log.info("UnregisterHotKey done (both forward and backward).")
 
         def _unregister_windows(self) -> None:
             if self._winhk_thread is not None:
-                tid = self._winhk_thread_id
-                if tid is not None:
-                    # Post WM_QUIT to break GetMessageW loop
-                    log.debug("Posting WM_QUIT to hotkey thread (tid=%d).", tid)
-                    _user32.PostThreadMessageW(tid, WM_QUIT, 0, 0)
+                stop_event = self._winhk_stop_event
+                if stop_event:
+                    log.debug("Signalling hotkey thread to stop.")
+                    _kernel32.SetEvent(stop_event)
                 self._winhk_thread.join(timeout=3)
+                if stop_event and not self._winhk_thread.is_alive():
+                    _kernel32.CloseHandle(stop_event)
                 self._winhk_thread = None
-                self._winhk_thread_id = None
+                self._winhk_stop_event = None
+                self._winhk_keys = None
 
     # ------------------------------------------------------------------
     # Linux/macOS hotkey registration (pynput)
@@ -541,7 +775,7 @@ class HotkeyHandler:
     def _on_hotkey(self) -> None:
         """Kick off the forward translate flow in a background thread."""
         log.info("Forward hotkey triggered!")
-        if not self._run_lock.acquire(blocking=False):
+        if not self._try_begin_run():
             log.warning("Hotkey ignored — another operation is in progress.")
             return
         threading.Thread(target=self._translate_flow, args=(False,), daemon=True).start()
@@ -549,31 +783,68 @@ class HotkeyHandler:
     def _on_backward_hotkey(self) -> None:
         """Kick off the backward translate flow in a background thread."""
         log.info("Backward hotkey triggered!")
-        if not self._run_lock.acquire(blocking=False):
+        if not self._try_begin_run():
             log.warning("Hotkey ignored — another operation is in progress.")
             return
         threading.Thread(target=self._translate_flow, args=(True,), daemon=True).start()
 
+    def _schedule_clipboard_restore(self, text: str, delay: float = 0.5) -> None:
+        timer = threading.Timer(delay, self._restore_clipboard)
+        timer.daemon = True
+        with self._restore_lock:
+            self._restore_timer = timer
+            self._restore_pending = text
+        timer.start()
+
+    def _restore_clipboard(self) -> None:
+        with self._restore_lock:
+            text, self._restore_pending = self._restore_pending, None
+            self._restore_timer = None
+            if text is None:
+                return
+            try:
+                _clip_set(text)
+            except Exception as exc:
+                log.warning("Failed to restore original clipboard: %s", exc)
+
+    def _cancel_clipboard_restore(self) -> str | None:
+        """Cancel a pending restore and return the text it would have written."""
+        with self._restore_lock:
+            text, self._restore_pending = self._restore_pending, None
+            timer, self._restore_timer = self._restore_timer, None
+        if timer is not None:
+            timer.cancel()
+        return text
+
     def _translate_flow(self, backward: bool = False) -> None:
+        # A restore still pending from the previous run holds the user's real
+        # clipboard; whatever path this run takes, that text must be put back.
+        pending_restore = self._cancel_clipboard_restore()
+        restore_text = pending_restore
+        self.drain_partial()  # drop partials the previous run queued after its last poll
         try:
-            # 1. Save current clipboard content
+            # 1. Save current clipboard content (at this point it may still hold
+            #    the previous translation — only *pending_restore* is the original)
             try:
-                original_clipboard = pyperclip.paste()
+                clipboard_before = _clip_get()
             except Exception:
-                original_clipboard = ""
+                clipboard_before = ""
+            original_clipboard = pending_restore if pending_restore is not None else clipboard_before
             log.debug("Original clipboard: %r", original_clipboard[:80] if original_clipboard else "")
 
             # 2. Simulate Ctrl+C to copy selected text
             log.debug("Sending Ctrl+C...")
+            seq0 = _clip_sequence()
             _send_ctrl_c()
-            time.sleep(0.25)
+            if not _wait_clip_change(seq0):
+                log.debug("Clipboard did not change after Ctrl+C.")
 
             # 3. Read the clipboard
-            selected_text = pyperclip.paste()
+            selected_text = _clip_get()
             log.debug("Clipboard after Ctrl+C: %r", selected_text[:80] if selected_text else "")
 
             # 4. If nothing was copied (or same as before), skip
-            if not selected_text or selected_text == original_clipboard:
+            if not selected_text or selected_text == clipboard_before:
                 log.info("No new text copied — skipping translation.")
                 return
 
@@ -582,35 +853,36 @@ class HotkeyHandler:
                 if self._on_busy_start:
                     self._on_busy_start()
 
-                base_url = self._settings["base_url"]
-                model = self._settings["model"]
+                rc = self._rc
+                base_url = rc.base_url
+                model = rc.model
 
-                if self._is_ollama_profile():
+                if rc.is_ollama:
                     self._ensure_ollama_model(base_url, model)
 
-                last_ui_update_t = 0.0
+                last_ui_update_ns = 0
 
                 def on_partial(text_so_far: str) -> None:
-                    nonlocal last_ui_update_t
-                    if not self._on_overlay_detail:
+                    nonlocal last_ui_update_ns
+                    now = time.monotonic_ns()
+                    if now - last_ui_update_ns < 80_000_000:  # 80 ms
                         return
-                    now = time.time()
-                    if (now - last_ui_update_t) < 0.08:
-                        return
-                    last_ui_update_t = now
+                    last_ui_update_ns = now
 
                     tail = text_so_far[-80:].replace("\n", " ").strip()
                     detail = f"{len(text_so_far)} chars — {tail}"
-                    self._on_overlay_detail(detail)
+                    self._partial_q.put_nowait(detail)
 
                 if backward:
-                    src_lang = self._settings["target_lang"]
-                    tgt_lang = self._settings["source_lang"]
+                    src_lang = rc.target_lang
+                    tgt_lang = rc.source_lang
                 else:
-                    src_lang = self._settings["source_lang"]
-                    tgt_lang = self._settings["target_lang"]
+                    src_lang = rc.source_lang
+                    tgt_lang = rc.target_lang
 
                 try:
+                    if self._on_stream_start:
+                        self._on_stream_start()
                     translated = translate(
                         text=selected_text,
                         base_url=base_url,
@@ -620,8 +892,10 @@ class HotkeyHandler:
                         on_partial=on_partial,
                     )
                 except Exception as exc:
-                    if self._is_ollama_profile() and self._is_model_not_found_error(exc, model):
-                        self._ensure_ollama_model(base_url, model)
+                    if rc.is_ollama and self._is_model_not_found_error(exc, model):
+                        self._ensure_ollama_model(base_url, model, use_cache=False)
+                        if self._on_stream_start:
+                            self._on_stream_start()
                         translated = translate(
                             text=selected_text,
                             base_url=base_url,
@@ -640,22 +914,143 @@ class HotkeyHandler:
                 return
 
             # 6. Write translation to clipboard and paste
-            pyperclip.copy(translated)
+            _clip_set(translated)
+            restore_text = original_clipboard if original_clipboard != translated else None
             time.sleep(0.05)
             _send_ctrl_v()
 
-            # 7. Restore original clipboard after a short delay
-            time.sleep(0.5)
-            pyperclip.copy(original_clipboard)
-
         except Exception as exc:
             if self._on_error:
                 self._on_error(str(exc))
         finally:
+            # 7. Restore original clipboard after a short delay, without keeping the handler busy
+            if restore_text is not None:
+                self._schedule_clipboard_restore(restore_text)
+            self._end_run()
+
+
+# ---------------------------------------------------------------------------
+# Clipboard access — platform-specific implementations
+# ---------------------------------------------------------------------------
+
+def _clip_backoff(ceiling: float = 1.5) -> Iterator[float]:
+    """Retry delays for a busy clipboard: 15 → 30 → 60 → 120 ms (capped), ~*ceiling* s in total."""
+    delay, total = 0.015, 0.0
+    while total + delay <= ceiling:
+        yield delay
+        total += delay
+        delay = min(delay * 2, 0.12)
+
+
+if _IS_WINDOWS:
+    def _open_clipboard(hwnd=None) -> None:
+        """Open the clipboard, backing off while another app holds it."""
+        if _user32.OpenClipboard(hwnd):
+            return
+        for delay in _clip_backoff():
+            time.sleep(delay)
+            if _user32.OpenClipboard(hwnd):
+                return
+        raise OSError(f"OpenClipboard failed (WinError {ctypes.GetLastError()}).")
+
+    def _clip_get() -> str:
+        """Return the clipboard's CF_UNICODETEXT content ("" if none)."""
+        _open_clipboard()
+        try:
+            handle = _user32.GetClipboardData(CF_UNICODETEXT)
+            if not handle:
+                return ""
+            ptr = _kernel32.GlobalLock(handle)
+            if not ptr:
+                return ""
             try:
-                self._run_lock.release()
-            except RuntimeError:
-                pass
+                return ctypes.wstring_at(ptr)
+            finally:
+                _kernel32.GlobalUnlock(handle)
+        finally:
+            _user32.CloseClipboard()
+
+    def _clip_set(text: str) -> None:
+        """Replace the clipboard content with *text* as CF_UNICODETEXT."""
+        data = (text or "").encode("utf-16-le") + b"\x00\x00"
+        handle = _kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            raise MemoryError("GlobalAlloc failed for clipboard data.")
+        ptr = _kernel32.GlobalLock(handle)
+        if not ptr:
+            _kernel32.GlobalFree(handle)
+            raise MemoryError("GlobalLock failed for clipboard data.")
+        ctypes.memmove(ptr, data, len(data))
+        _kernel32.GlobalUnlock(handle)
+
+        # EmptyClipboard after OpenClipboard(NULL) leaves no owner and makes
+        # SetClipboardData fail, so open it with a real window. Windows belong to
+        # the thread that creates them, and callers run on short-lived worker and
+        # timer threads, so the window lives only for this call.
+        hwnd = _user32.CreateWindowExW(0, "STATIC", None, 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None)
+        if not hwnd:
+            _kernel32.GlobalFree(handle)
+            raise OSError(f"CreateWindowExW failed (WinError {ctypes.GetLastError()}).")
+        try:
+            try:
+                _open_clipboard(hwnd)
+            except OSError:
+                _kernel32.GlobalFree(handle)
+                raise
+            try:
+                _user32.EmptyClipboard()
+                if not _user32.SetClipboardData(CF_UNICODETEXT, handle):
+                    # Ownership was not transferred to the system — free it ourselves.
+                    _kernel32.GlobalFree(handle)
+                    raise OSError(f"SetClipboardData failed (WinError {ctypes.GetLastError()}).")
+            finally:
+                _user32.CloseClipboard()
+        finally:
+            _user32.DestroyWindow(hwnd)
+
+    def _clip_sequence() -> int:
+        return _user32.GetClipboardSequenceNumber()
+
+    def _wait_clip_change(seq0: int, timeout: float = 0.5) -> bool:
+        """Poll the clipboard sequence number until it moves past *seq0*.
+
+        Returns as soon as the target app has written the clipboard instead of
+        sleeping a fixed amount; gives up after *timeout* seconds. The poll
+        interval backs off 5 → 10 → 15 ms (the default Windows timer tick).
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            if _user32.GetClipboardSequenceNumber() != seq0:
+                return True
+            delay = min(delay + 0.005, 0.015)
+        return False
+
+else:
+    def _pyperclip_retry(fn, *args):
+        """Call a pyperclip function, backing off while the clipboard is unavailable."""
+        for delay in (*_clip_backoff(), None):
+            try:
+                return fn(*args)
+            except (pyperclip.PyperclipException, OSError):
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    def _clip_get() -> str:
+        return _pyperclip_retry(pyperclip.paste)
+
+    def _clip_set(text: str) -> None:
+        _pyperclip_retry(pyperclip.copy, text)
+
+    def _clip_sequence() -> int:
+        # No cheap change counter here; _wait_clip_change falls back to a fixed delay.
+        return 0
+
+    def _wait_clip_change(_seq0: int, timeout: float = 0.25) -> bool:
+        time.sleep(timeout)
+        return True
 
 
 # ---------------------------------------------------------------------------
@@ -663,7 +1058,10 @@ class HotkeyHandler:
 # ---------------------------------------------------------------------------
 
 if _IS_WINDOWS:
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_EXTENDEDKEY = 0x0001
     KEYEVENTF_KEYUP = 0x0002
+    MAPVK_VK_TO_VSC = 0
     VK_CONTROL = 0x11
     VK_MENU = 0x12      # Alt
     VK_SHIFT = 0x10
@@ -672,29 +1070,91 @@ if _IS_WINDOWS:
     VK_C = 0x43
     VK_V = 0x56
 
-    def _keybd_event(vk: int, flags: int = 0) -> None:
-        _user32.keybd_event(vk, 0, flags, 0)
-
-    def _release_all_modifiers() -> None:
-        """Release all modifier keys that may be physically held from the hotkey."""
-        for vk in (VK_CONTROL, VK_MENU, VK_SHIFT, VK_LWIN, VK_RWIN):
-            _keybd_event(vk, KEYEVENTF_KEYUP)
+    # Modifiers that may still be physically held from the hotkey itself.
+    _MODIFIER_VKS = (VK_CONTROL, VK_MENU, VK_SHIFT, VK_LWIN, VK_RWIN)
+    # Keys that live in the extended part of the keyboard and need KEYEVENTF_EXTENDEDKEY.
+    _EXTENDED_VKS = frozenset((VK_LWIN, VK_RWIN))
+
+    # SendInput structures (see MSDN: INPUT / KEYBDINPUT). MOUSEINPUT is the
+    # largest union member, so it must be declared for sizeof(INPUT) to match.
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", ctypes.wintypes.LONG),
+            ("dy", ctypes.wintypes.LONG),
+            ("mouseData", ctypes.wintypes.DWORD),
+            ("dwFlags", ctypes.wintypes.DWORD),
+            ("time", ctypes.wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", ctypes.wintypes.WORD),
+            ("wScan", ctypes.wintypes.WORD),
+            ("dwFlags", ctypes.wintypes.DWORD),
+            ("time", ctypes.wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _HARDWAREINPUT(ctypes.Structure):
+        _fields_ = [
+            ("uMsg", ctypes.wintypes.DWORD),
+            ("wParamL", ctypes.wintypes.WORD),
+            ("wParamH", ctypes.wintypes.WORD),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", ctypes.wintypes.DWORD), ("u", _INPUTUNION)]
+
+    # Bound once so the per-keystroke path skips the WinDLL attribute lookup.
+    _SendInput = _user32.SendInput
+    _SendInput.argtypes = [ctypes.wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int]
+    _SendInput.restype = ctypes.wintypes.UINT
+    _MapVirtualKeyW = _user32.MapVirtualKeyW
+    _MapVirtualKeyW.argtypes = [ctypes.wintypes.UINT, ctypes.wintypes.UINT]
+    _MapVirtualKeyW.restype = ctypes.wintypes.UINT
+    _SIZEOF_INPUT = ctypes.sizeof(_INPUT)
+    _GetAsyncKeyState = _user32.GetAsyncKeyState
+    _GetAsyncKeyState.argtypes = [ctypes.c_int]
+    _GetAsyncKeyState.restype = ctypes.wintypes.SHORT
+
+    def _key_input(vk: int, flags: int = 0) -> _INPUT:
+        if vk in _EXTENDED_VKS:
+            flags |= KEYEVENTF_EXTENDEDKEY
+        scan = _MapVirtualKeyW(vk, MAPVK_VK_TO_VSC)
+        return _INPUT(type=INPUT_KEYBOARD, u=_INPUTUNION(ki=_KEYBDINPUT(vk, scan, flags, 0, 0)))
+
+    def _send_inputs(inputs: list[_INPUT]) -> None:
+        """Inject all key events with a single (atomic) SendInput call."""
+        n = len(inputs)
+        arr = (_INPUT * n)(*inputs)
+        sent = _SendInput(n, arr, _SIZEOF_INPUT)
+        if sent != n:
+            log.warning("SendInput injected %d of %d events (WinError %d).", sent, n, ctypes.GetLastError())
+
+    def _send_ctrl_combo(vk: int) -> None:
+        """Release held modifiers, then press Ctrl+<vk> — all in one batch."""
+        inputs = [
+            _key_input(m, KEYEVENTF_KEYUP)
+            for m in _MODIFIER_VKS
+            if _GetAsyncKeyState(m) & 0x8000
+        ]
+        inputs += [
+            _key_input(VK_CONTROL),
+            _key_input(vk),
+            _key_input(vk, KEYEVENTF_KEYUP),
+            _key_input(VK_CONTROL, KEYEVENTF_KEYUP),
+        ]
+        _send_inputs(inputs)
 
     def _send_ctrl_c() -> None:
-        _release_all_modifiers()
-        time.sleep(0.05)
-        _keybd_event(VK_CONTROL)
-        _keybd_event(VK_C)
-        _keybd_event(VK_C, KEYEVENTF_KEYUP)
-        _keybd_event(VK_CONTROL, KEYEVENTF_KEYUP)
+        _send_ctrl_combo(VK_C)
 
     def _send_ctrl_v() -> None:
-        _release_all_modifiers()
-        time.sleep(0.05)
-        _keybd_event(VK_CONTROL)
-        _keybd_event(VK_V)
-        _keybd_event(VK_V, KEYEVENTF_KEYUP)
-        _keybd_event(VK_CONTROL, KEYEVENTF_KEYUP)
+        _send_ctrl_combo(VK_V)
 
 else:
     def _release_all_modifiers() -> None:
@@ -4,9 +4,12 @@ Starts the system-tray icon and the Tkinter settings UI.
 Global hotkey is registered on startup.
 """
 
+from __future__ import annotations
+
 import logging
 import sys
 import threading
+from typing import TYPE_CHECKING
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -14,38 +17,36 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
-from PIL import Image, ImageDraw
-import pystray
-
 from settings_manager import load_settings
-from hotkey_handler import HotkeyHandler
-from overlay import TranslatingOverlay
-from ui import SettingsWindow
+
+if TYPE_CHECKING:
+    import pystray
+    from PIL import Image
+
+# Heavy modules (PIL, pystray, requests via hotkey_handler, Tk UI) are imported
+# inside the functions that need them, keeping `import main` itself cheap.
 
 
 # ---------------------------------------------------------------
 # Tray icon helper
 # ---------------------------------------------------------------
 
-def _create_tray_image(size: int = 64) -> Image.Image:
-    """Generate a simple coloured-square icon for the system tray."""
-    img = Image.new("RGB", (size, size), "#2196F3")
-    draw = ImageDraw.Draw(img)
-    # Draw a white "T" in the centre
-    margin = size // 5
-    bar_h = size // 8
-    stem_w = size // 6
-    # Top bar
-    draw.rectangle(
-        [margin, margin, size - margin, margin + bar_h], fill="white"
-    )
-    # Vertical stem
-    cx = size // 2
-    draw.rectangle(
-        [cx - stem_w // 2, margin + bar_h, cx + stem_w // 2, size - margin],
-        fill="white",
-    )
-    return img
+# 64x64 blue square with a white "T" (pre-rendered PNG so startup skips the drawing code).
+_TRAY_ICON_PNG_B64 = (
+    b"iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAIAAAAlC+aJAAAAfElEQVR42u3YwQmAMBAEwCh52oR2Z0OmuzShBViCBg9iYPYdjgwcLNy0HmcaOXMa"
+    b"PAAAAAAAAAA9k988qvvS639buawQAAAAAMDHIntsk6bWa5pmhQAAAAAAAAAAAAAAAAAAAAAAAAAAAADik8Mnxp7/rRAAAAAAAMCvcwMVcguK04jr"
+    b"hgAAAABJRU5ErkJggg=="
+)
+
+
+def _create_tray_image() -> Image.Image:
+    """Load the system tray icon from the embedded PNG."""
+    import base64
+    import io
+
+    from PIL import Image
+
+    return Image.open(io.BytesIO(base64.b64decode(_TRAY_ICON_PNG_B64)))
 
 
 # ---------------------------------------------------------------
@@ -73,6 +74,10 @@ def main() -> None:
 
     settings = load_settings()
 
+    from hotkey_handler import HotkeyHandler
+    from overlay import TranslatingOverlay
+    from ui import SettingsWindow
+
     # -- Settings window (Tkinter) --------------------------------------
     handler = None  # assigned after overlay is created
 
@@ -93,13 +98,16 @@ def main() -> None:
         on_busy_end=overlay.hide_threadsafe,
         on_overlay_message=overlay.set_message_threadsafe,
         on_overlay_progress=overlay.set_progress_threadsafe,
-        on_overlay_detail=overlay.set_detail_threadsafe,
         on_download_progress=win.set_download_progress_threadsafe,
+        on_stream_start=overlay.start_detail_poll_threadsafe,
     )
+    overlay.set_detail_source(handler.drain_partial)
     win.set_download_model_callback(handler.download_model_async)
     win.set_unload_models_callback(handler.unload_ollama_models_async)
 
     # -- System tray icon ------------------------------------------------
+    import pystray
+
     def on_show_settings(icon, item):  # noqa: ARG001
         win.root.after(0, win.show)
 
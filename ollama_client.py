@@ -1,12 +1,32 @@
 from __future__ import annotations
 
-import json
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+try:  # optional, faster parser for the NDJSON pull stream
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
+# Shared session so repeated probes reuse the TCP connection to the Ollama server.
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# /api/tags results per Ollama root: root -> (monotonic timestamp, model names).
+_TAGS_TTL = 30.0
+_tags_cache: dict[str, tuple[float, frozenset[str]]] = {}
+
+
+@functools.lru_cache(maxsize=8)
 def _ollama_root_from_base_url(base_url: str) -> str:
     """
     Convert an OpenAI-compatible base URL like:
@@ -20,11 +40,24 @@ def _ollama_root_from_base_url(base_url: str) -> str:
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
-def list_models(base_url: str) -> set[str]:
-    """Return a set of installed model names from Ollama (/api/tags)."""
+def list_models(
+    base_url: str,
+    session: requests.Session | None = None,
+    max_age: float = _TAGS_TTL,
+) -> set[str]:
+    """
+    Return a set of installed model names from Ollama (/api/tags).
+
+    Results are cached per server for max_age seconds (0 forces a request);
+    pull_model drops the cached entry when it finishes.
+    """
     root = _ollama_root_from_base_url(base_url)
+    cached = _tags_cache.get(root)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return set(cached[1])
+
     url = f"{root}/api/tags"
-    resp = requests.get(url, timeout=15)
+    resp = (session or _HTTP).get(url, timeout=15)
     resp.raise_for_status()
     data = resp.json()
 
@@ -33,6 +66,7 @@ def list_models(base_url: str) -> set[str]:
         name = item.get("name")
         if isinstance(name, str) and name:
             models.add(name)
+    _tags_cache[root] = (time.monotonic(), frozenset(models))
     return models
 
 
@@ -40,26 +74,89 @@ def pull_model(
     base_url: str,
     model: str,
     on_progress: Callable[[str, int | None], None] | None = None,
+    session: requests.Session | None = None,
 ) -> None:
     """
     Pull a model via Ollama (/api/pull) with streamed progress.
 
     Calls on_progress(status, percent) where percent may be None if unknown.
+    on_progress runs on a helper thread and only ever sees the newest event,
+    so a slow callback never stalls reading the HTTP stream.
     """
     root = _ollama_root_from_base_url(base_url)
     url = f"{root}/api/pull"
     payload = {"name": model, "stream": True}
 
-    with requests.post(url, json=payload, stream=True, timeout=60) as resp:
+    reporter = _LatestProgress(on_progress) if on_progress else None
+    try:
+        _pull_stream(url, payload, session or _HTTP, reporter)
+    except BaseException:
+        if reporter:
+            reporter.close(raise_error=False)
+        raise
+    finally:
+        _tags_cache.pop(root, None)
+    if reporter:
+        reporter.close()
+
+
+class _LatestProgress:
+    """Deliver (status, percent) events to a callback on a worker thread, newest-wins."""
+
+    _DONE = object()
+
+    def __init__(self, callback: Callable[[str, int | None], None]):
+        self._callback = callback
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def put(self, status: str, percent: int | None) -> None:
+        self._put((status, percent))
+
+    def close(self, raise_error: bool = True) -> None:
+        """Deliver the last pending event, stop the worker, and re-raise a callback error."""
+        self._queue.put(self._DONE)  # blocking: never displaces the final event
+        self._thread.join()
+        if raise_error and self._error is not None:
+            raise self._error
+
+    def _put(self, item) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()  # drop the stale event
+                except queue.Empty:
+                    pass
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._callback(*item)
+            except BaseException as exc:
+                self._error = exc
+
+
+def _pull_stream(url: str, payload: dict, session: requests.Session, reporter: _LatestProgress | None) -> None:
+    with session.post(url, json=payload, stream=True, timeout=60) as resp:
         resp.raise_for_status()
-        resp.encoding = "utf-8"
 
-        for raw_line in resp.iter_lines(decode_unicode=True):
+        # Raw bytes: both json.loads and orjson parse UTF-8 bytes directly.
+        for raw_line in resp.iter_lines():
             if not raw_line:
                 continue
             try:
-                evt = json.loads(raw_line)
-            except json.JSONDecodeError:
+                evt = _json_loads(raw_line)
+            except ValueError:  # JSONDecodeError or invalid UTF-8
                 continue
 
             status = evt.get("status")
@@ -72,15 +169,15 @@ def pull_model(
             if isinstance(completed, (int, float)) and isinstance(total, (int, float)) and total:
                 percent = int(max(0, min(100, (completed / total) * 100)))
 
-            if on_progress:
-                on_progress(status, percent)
+            if reporter:
+                reporter.put(status, percent)
 
 
-def list_running_models(base_url: str) -> list[str]:
+def list_running_models(base_url: str, session: requests.Session | None = None) -> list[str]:
     """Return list of models currently loaded into memory (/api/ps)."""
     root = _ollama_root_from_base_url(base_url)
     url = f"{root}/api/ps"
-    resp = requests.get(url, timeout=10)
+    resp = (session or _HTTP).get(url, timeout=10)
     resp.raise_for_status()
     data = resp.json()
 
@@ -92,24 +189,29 @@ def list_running_models(base_url: str) -> list[str]:
     return running
 
 
-def unload_model(base_url: str, model: str) -> None:
+def unload_model(base_url: str, model: str, session: requests.Session | None = None) -> None:
     """Unload one model from memory using keep_alive=0."""
     root = _ollama_root_from_base_url(base_url)
     url = f"{root}/api/generate"
     payload = {"model": model, "keep_alive": 0}
-    resp = requests.post(url, json=payload, timeout=15)
+    resp = (session or _HTTP).post(url, json=payload, timeout=15)
     resp.raise_for_status()
 
 
-def unload_all_running_models(base_url: str) -> list[str]:
+def unload_all_running_models(base_url: str, session: requests.Session | None = None) -> list[str]:
     """Unload all running models (best-effort). Returns list attempted."""
-    running = list_running_models(base_url)
-    attempted = []
-    for name in running:
-        attempted.append(name)
+    running = list_running_models(base_url, session=session)
+    if not running:
+        return []
+
+    def safe_unload(name: str) -> None:
         try:
-            unload_model(base_url, name)
+            unload_model(base_url, name, session=session)
         except Exception:
             # Best-effort; continue unloading others.
             pass
-    return attempted
+
+    # Independent requests — run them concurrently so total time is max(), not sum().
+    with ThreadPoolExecutor(max_workers=min(8, len(running))) as ex:
+        list(ex.map(safe_unload, running))
+    return list(running)
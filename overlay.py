@@ -1,10 +1,14 @@
+import threading
 import tkinter as tk
+from collections.abc import Callable
 from tkinter import ttk
 
 
 class TranslatingOverlay:
     """A small always-on-top overlay shown during translation."""
 
+    _ANIM_FRAMES = ("", ".", "..", "...")
+
     def __init__(self, root: tk.Tk, bottom_padding_px: int = 80):
         self._root = root
         self._bottom_padding_px = bottom_padding_px
@@ -38,11 +42,29 @@ class TranslatingOverlay:
         )
         self._detail_label.grid(sticky="ew")
 
+        self._visible = False
         self._anim_job = None
         self._anim_step = 0
+        self._anim_frame: str | None = None  # frame currently shown (None = detail overwritten)
         self._indeterminate = True
         self._manual_detail = False
 
+        # Polled only while a translation is streaming (see start_detail_poll_threadsafe).
+        self._detail_source: Callable[[], str | None] | None = None
+        self._detail_poll_job = None
+        self._detail_poll_ms = 16
+
+        # Cross-thread state updates, coalesced into one Tk callback per ~16 ms.
+        # Keys are method names; re-setting a key moves it last so order is kept.
+        self._pending_lock = threading.Lock()
+        self._pending: dict[str, object] = {}
+        self._pending_scheduled = False
+        self._pending_flush_ms = 16
+
+        # At most one queued re-position; geometry is only re-applied when it changes.
+        self._reposition_queued = False
+        self._last_geometry: str | None = None
+
     # ------------------------------------------------------------------
     # Public API (UI thread)
     # ------------------------------------------------------------------
@@ -51,39 +73,75 @@ class TranslatingOverlay:
         self._position_bottom_center()
         self._window.deiconify()
         self._window.lift()
+        self._visible = True
         # Default: translating animation
         self._message_var.set("Translating")
         self._manual_detail = False
         self._set_progress(None)
+        self._stop_detail_poll()  # restarted by start_detail_poll_threadsafe once streaming begins
 
     def hide(self) -> None:
+        self._visible = False
         self._stop_animation()
+        self._stop_detail_poll()
         self._window.withdraw()
 
+    def set_detail_source(self, source: Callable[[], str | None] | None) -> None:
+        """Set a callable polled (~60 Hz) while streaming; a non-None result becomes the detail line."""
+        self._detail_source = source
+
     # ------------------------------------------------------------------
     # Thread-safe helpers
     # ------------------------------------------------------------------
 
     def show_threadsafe(self) -> None:
-        self._root.after(0, self.show)
+        self._post_pending("show", reset=True)
 
     def hide_threadsafe(self) -> None:
-        self._root.after(0, self.hide)
+        self._post_pending("hide", reset=True)
 
     def set_message_threadsafe(self, text: str) -> None:
-        self._root.after(0, self._set_message, text)
+        self._post_pending("_set_message", text)
 
     def set_progress_threadsafe(self, percent: int | None) -> None:
-        self._root.after(0, self._set_progress, percent)
-
-    def set_detail_threadsafe(self, text: str) -> None:
-        self._root.after(0, self._set_detail, text)
+        self._post_pending("_set_progress", percent)
+
+    def start_detail_poll_threadsafe(self) -> None:
+        """Start polling the detail source; call when a translation starts streaming."""
+        self._post_pending("_start_detail_poll")
+
+    def _post_pending(self, setter: str, *args, reset: bool = False) -> None:
+        with self._pending_lock:
+            if reset:
+                # show/hide reset the overlay, so anything queued before them is moot.
+                self._pending.clear()
+            else:
+                self._pending.pop(setter, None)
+            self._pending[setter] = args
+            if self._pending_scheduled:
+                return
+            self._pending_scheduled = True
+        self._root.after(self._pending_flush_ms, self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            self._pending_scheduled = False
+        for setter, args in pending.items():
+            getattr(self, setter)(*args)
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
+    def _request_reposition(self) -> None:
+        if self._reposition_queued:
+            return
+        self._reposition_queued = True
+        self._root.after_idle(self._position_bottom_center)
+
     def _position_bottom_center(self) -> None:
+        self._reposition_queued = False
         self._window.update_idletasks()
         # Use requested size so window can grow when text wraps to more lines.
         win_w = self._window.winfo_reqwidth()
@@ -93,7 +151,11 @@ class TranslatingOverlay:
 
         x = (screen_w - win_w) // 2
         y = screen_h - win_h - self._bottom_padding_px
-        self._window.geometry(f"{win_w}x{win_h}+{x}+{y}")
+        geometry = f"{win_w}x{win_h}+{x}+{y}"
+        if geometry == self._last_geometry:
+            return
+        self._last_geometry = geometry
+        self._window.geometry(geometry)
 
     def _set_progress(self, percent: int | None) -> None:
         if percent is None:
@@ -102,33 +164,64 @@ class TranslatingOverlay:
         else:
             self._indeterminate = False
             self._stop_animation()
+            self._stop_detail_poll()  # download mode: no partials to show
             self._manual_detail = False
+            self._anim_frame = None
             self._detail_var.set(f"{int(percent)}%")
-            self._root.after_idle(self._position_bottom_center)
+            self._request_reposition()
 
     def _set_message(self, text: str) -> None:
         self._message_var.set(text)
-        self._root.after_idle(self._position_bottom_center)
+        self._request_reposition()
 
     def _set_detail(self, text: str) -> None:
         # When streaming partials are shown, do not let dot animation overwrite detail.
         self._manual_detail = True
+        self._anim_frame = None
         self._detail_var.set(text)
-        self._root.after_idle(self._position_bottom_center)
+        self._request_reposition()
 
     def _start_animation(self) -> None:
         if self._anim_job is not None:
             return
         self._anim_step = 0
+        self._anim_frame = None
         self._tick_animation()
 
     def _tick_animation(self) -> None:
-        dots = "." * (self._anim_step % 4)
-        if self._indeterminate and not self._manual_detail:
-            self._detail_var.set(dots)
+        if not self._visible or not self._indeterminate:
+            self._anim_job = None
+            return
+        frame = self._ANIM_FRAMES[self._anim_step & 3]
+        if self._indeterminate and not self._manual_detail and frame != self._anim_frame:
+            self._detail_var.set(frame)
+            self._anim_frame = frame
         self._anim_step += 1
         self._anim_job = self._window.after(250, self._tick_animation)
 
+    def _start_detail_poll(self) -> None:
+        if not self._visible or self._detail_poll_job is not None or self._detail_source is None:
+            return
+        self._poll_detail()
+
+    def _poll_detail(self) -> None:
+        if not self._visible:
+            self._detail_poll_job = None
+            return
+        text = self._detail_source() if self._detail_source is not None else None
+        if text is not None:
+            self._set_detail(text)
+        self._detail_poll_job = self._window.after(self._detail_poll_ms, self._poll_detail)
+
+    def _stop_detail_poll(self) -> None:
+        if self._detail_poll_job is None:
+            return
+        try:
+            self._window.after_cancel(self._detail_poll_job)
+        except Exception:
+            pass
+        self._detail_poll_job = None
+
     def _stop_animation(self) -> None:
         if self._anim_job is None:
             return
@@ -1,5 +1,7 @@
+import copy
 import json
 import os
+import re
 
 SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
 
@@ -34,18 +36,35 @@ DEFAULT_SETTINGS = {
     },
 }
 
+# Last migrated result, keyed by settings.json (mtime_ns, size); None key = no file.
+_cache: tuple[tuple[int, int] | None, dict] | None = None
+
 
 def load_settings() -> dict:
     """Load settings from settings.json, returning defaults for any missing keys."""
-    settings = json.loads(json.dumps(DEFAULT_SETTINGS))  # deep copy
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                stored = json.load(f)
-            if isinstance(stored, dict):
-                settings.update(stored)
-        except (json.JSONDecodeError, OSError):
-            pass
+    global _cache
+    try:
+        st = os.stat(SETTINGS_FILE)
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    cached = _cache
+    if cached is not None and cached[0] == key:
+        return copy.deepcopy(cached[1])
+    settings = _load_settings_uncached()
+    _cache = (key, copy.deepcopy(settings))
+    return settings
+
+
+def _load_settings_uncached() -> dict:
+    settings = copy.deepcopy(DEFAULT_SETTINGS)
+    try:
+        with open(SETTINGS_FILE, "rb") as f:
+            stored = json.loads(f.read())
+        if isinstance(stored, dict):
+            settings.update(stored)
+    except (ValueError, OSError):  # missing/unreadable file, JSONDecodeError or invalid UTF-8
+        pass
 
     # --- Migration from legacy schema (top-level base_url/model only) ---
     profiles = settings.get("profiles")
@@ -58,12 +77,12 @@ def load_settings() -> dict:
     # Ensure standard profiles exist (do not clobber if user customized them)
     for name, defaults in DEFAULT_SETTINGS["profiles"].items():
         if name not in profiles or not isinstance(profiles.get(name), dict):
-            profiles[name] = json.loads(json.dumps(defaults))
+            profiles[name] = copy.deepcopy(defaults)
         else:
             # fill missing keys
             for k, v in defaults.items():
                 if k not in profiles[name]:
-                    profiles[name][k] = json.loads(json.dumps(v))
+                    profiles[name][k] = copy.deepcopy(v)
             # merge default model presets (append missing)
             default_presets = defaults.get("model_presets")
             if isinstance(default_presets, list):
@@ -138,17 +157,24 @@ _SC_TO_NAME: dict[int, str] = {
     42: "shift", 54: "shift", 91: "windows", 92: "windows",
 }
 
+# Same map as a dense tuple indexed by scan code (the dict stays the source of truth).
+_SC_NAMES: tuple[str | None, ...] = tuple(_SC_TO_NAME.get(sc) for sc in range(max(_SC_TO_NAME) + 1))
+
+_SC_RE = re.compile(r"sc(\d+)")
+
 
 def _normalize_hotkey(hotkey: str) -> str:
     """Replace legacy 'scNN' tokens with human-readable QWERTY names."""
-    import re
-    parts = [p.strip().lower() for p in hotkey.split("+") if p.strip()]
+    hotkey = hotkey.lower()
+    parts = [p.strip() for p in hotkey.split("+") if p.strip()]
+    if "sc" not in hotkey:  # no legacy tokens possible
+        return "+".join(parts)
     normalized: list[str] = []
     for p in parts:
-        m = re.fullmatch(r"sc(\d+)", p)
+        m = _SC_RE.fullmatch(p)
         if m:
             sc = int(m.group(1))
-            name = _SC_TO_NAME.get(sc, p)
+            name = (_SC_NAMES[sc] if sc < len(_SC_NAMES) else None) or p
             normalized.append(name)
         else:
             normalized.append(p)
@@ -156,6 +182,14 @@ def _normalize_hotkey(hotkey: str) -> str:
 
 
 def save_settings(settings: dict) -> None:
-    """Persist settings dict to settings.json."""
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=4, ensure_ascii=False)
+    """Persist settings dict to settings.json (atomically, via a temp file)."""
+    global _cache
+    _cache = None
+    tmp_path = SETTINGS_FILE + ".tmp"
+    data = json.dumps(settings, indent=2, ensure_ascii=False)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    # A crash mid-write leaves the old settings.json intact instead of a truncated one.
+    os.replace(tmp_path, SETTINGS_FILE)
@@ -1,11 +1,43 @@
+import functools
 import json
 import logging
+import time
 from collections.abc import Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # optional, faster parser for the SSE chunks
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 log = logging.getLogger(__name__)
 
+# Shared session so repeated hotkey translations reuse the keep-alive connection.
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_PROMPT_TEMPLATE = (
+    "Translate the following segment into {target_lang} language, "
+    "without additional explanation.\n\n"
+    "{text}"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _chat_url(base_url: str) -> str:
+    return f"{base_url.rstrip('/')}/chat/completions"
+
+
+def _post_json(url: str, payload: dict, **kwargs) -> requests.Response:
+    """POST payload as a JSON body serialized once here, not by requests' json= path."""
+    body = json.dumps(payload).encode("utf-8")
+    return _HTTP.post(url, data=body, headers=_JSON_HEADERS, **kwargs)
+
 
 def translate(
     text: str,
@@ -19,25 +51,22 @@ def translate(
 
     Returns the translated string, or raises an exception on failure.
     """
-    url = f"{base_url.rstrip('/')}/chat/completions"
+    url = _chat_url(base_url)
 
     payload = {
         "model": model,
         "messages": [
             {
                 "role": "user",
-                "content": (
-                    f"Translate the following segment into {target_lang} language, "
-                    "without additional explanation.\n\n"
-                    f"{text}"
-                ),
+                "content": _PROMPT_TEMPLATE.format(target_lang=target_lang, text=text),
             },
         ],
         "temperature": 0.1,
     }
 
     log.info("POST %s", url)
-    log.debug("Request payload:\n%s", json.dumps(payload, indent=2, ensure_ascii=False))
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Request payload:\n%s", json.dumps(payload, indent=2, ensure_ascii=False))
 
     if on_partial is not None:
         try:
@@ -50,11 +79,12 @@ def translate(
 
 
 def _translate_non_stream(url: str, payload: dict) -> str:
-    response = requests.post(url, json=payload, timeout=30)
+    response = _post_json(url, payload, timeout=30)
     response.encoding = "utf-8"
 
     log.info("Response status: %s", response.status_code)
-    log.debug("Response body:\n%s", response.text)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Response body:\n%s", response.text)
 
     response.raise_for_status()
 
@@ -73,52 +103,55 @@ def _translate_streaming(url: str, payload: dict, on_partial: Callable[[str], No
     payload = dict(payload)
     payload["stream"] = True
 
-    # Long reads are expected during generation.
-    response = requests.post(url, json=payload, stream=True, timeout=(10, 300))
-    response.encoding = "utf-8"
-    log.info("Streaming response status: %s", response.status_code)
-    response.raise_for_status()
-
-    content_type = (response.headers.get("content-type") or "").lower()
-    if "text/event-stream" not in content_type:
-        # Some servers still stream without correct header; keep going if data: lines appear.
-        log.debug("Unexpected streaming Content-Type: %r", content_type)
-
-    text_so_far = ""
-    saw_data_line = False
-
-    for raw_line in response.iter_lines(decode_unicode=True):
-        if raw_line is None:
-            continue
-        line = raw_line.strip()
-        if not line:
-            continue
-        if not line.startswith("data:"):
-            continue
-
-        saw_data_line = True
-        data_str = line[len("data:") :].strip()
-        if data_str == "[DONE]":
-            break
-
-        try:
-            data = json.loads(data_str)
-        except Exception:
-            # Not valid JSON in data line => treat as streaming failure.
-            raise ValueError(f"Invalid SSE JSON chunk: {data_str[:120]!r}")
-
-        try:
-            choice0 = (data.get("choices") or [])[0]
-            delta = choice0.get("delta") or {}
-            chunk = delta.get("content")
-        except Exception:
-            chunk = None
-
-        if isinstance(chunk, str) and chunk:
-            text_so_far += chunk
-            on_partial(text_so_far)
+    # Long reads are expected during generation. The response is closed on exit
+    # (including the early break on [DONE]) rather than whenever it is collected.
+    with _post_json(url, payload, stream=True, timeout=(10, 300)) as response:
+        log.info("Streaming response status: %s", response.status_code)
+        response.raise_for_status()
+
+        content_type = (response.headers.get("content-type") or "").lower()
+        if "text/event-stream" not in content_type:
+            # Some servers still stream without correct header; keep going if data: lines appear.
+            log.debug("Unexpected streaming Content-Type: %r", content_type)
+
+        # Deltas are collected and joined at most ~30 times/s for on_partial, so
+        # long generations stay linear instead of re-copying the prefix per token.
+        chunks: list[str] = []
+        last_partial_ns = 0
+        saw_data_line = False
+
+        # Raw bytes: only the payload after "data:" is parsed, and the JSON
+        # parser decodes UTF-8 itself.
+        for raw_line in response.iter_lines():
+            if not raw_line.startswith(b"data:"):
+                continue
+
+            saw_data_line = True
+            data_str = raw_line[5:].strip()
+            if data_str == b"[DONE]":
+                break
+
+            try:
+                data = _json_loads(data_str)
+            except Exception:
+                # Not valid JSON in data line => treat as streaming failure.
+                raise ValueError(f"Invalid SSE JSON chunk: {data_str[:120]!r}")
+
+            try:
+                choice0 = (data.get("choices") or [])[0]
+                delta = choice0.get("delta") or {}
+                chunk = delta.get("content")
+            except Exception:
+                chunk = None
+
+            if isinstance(chunk, str) and chunk:
+                chunks.append(chunk)
+                now = time.monotonic_ns()
+                if now - last_partial_ns >= 33_000_000:
+                    last_partial_ns = now
+                    on_partial("".join(chunks))
 
     if not saw_data_line:
         raise ValueError("No SSE data lines received (streaming not supported?)")
 
-    return text_so_far.strip()
+    return "".join(chunks).strip()
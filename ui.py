@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-import keyboard
+import queue
 import threading
 import time
 
@@ -28,6 +28,22 @@ class SettingsWindow:
         self._recording_hotkey = False
         self._download_in_progress = False
         self._model_check_job = None
+        self._suppress_traces = False  # set while fields are filled in bulk
+        self._progress_lock = threading.Lock()
+        self._pending_progress: tuple[bool, str, int | None] | None = None
+        self._progress_scheduled = False
+        # What the download progress widgets currently show (see _set_download_progress).
+        self._progress_visible = False
+        self._progress_mode: str | None = None
+        self._progress_percent: int | None = None
+        # Trailing-edge debounce: one timer, pushed back by edits instead of re-created.
+        self._model_check_due = 0.0
+        self._model_check_key: tuple[str, str, str] | None = None
+        # One long-lived checker thread, fed newest-wins; results carrying an
+        # older sequence number than _check_seq are discarded.
+        self._check_seq = 0
+        self._check_queue: queue.Queue[tuple[int, str, str]] = queue.Queue(maxsize=1)
+        self._check_thread: threading.Thread | None = None
 
         # -- Root window ---------------------------------------------------
         self.root = tk.Tk()
@@ -37,57 +53,48 @@ class SettingsWindow:
 
         # -- Style ----------------------------------------------------------
         style = ttk.Style(self.root)
-        style.theme_use("clam")
+        if style.theme_use() != "clam":  # switching re-evaluates every style; skip if already set
+            style.theme_use("clam")
 
         main_frame = ttk.Frame(self.root, padding=16)
         main_frame.grid(sticky="nsew")
 
         # -- Fields ---------------------------------------------------------
-        settings = load_settings()
-        profiles = settings.get("profiles", {})
+        # Kept for profile switches; refreshed on Save and reload_fields().
+        self._settings = settings = load_settings()
+        # Sanitized model presets per profile, derived from self._settings.
+        self._presets_cache: dict[str, tuple[str, ...]] = {}
         active_profile = settings.get("active_profile", "Custom")
         row = 0
 
+        def combo_row(var: tk.StringVar, values: tuple[str, ...], state: str = "normal") -> ttk.Combobox:
+            """Full-width combobox in the value columns of the current row."""
+            combo = ttk.Combobox(main_frame, textvariable=var, values=values, state=state, width=45)
+            combo.grid(row=row, column=1, columnspan=2, sticky="ew", pady=4, padx=(8, 0))
+            return combo
+
         ttk.Label(main_frame, text="Profile:").grid(row=row, column=0, sticky="w", pady=4)
         self._profile_var = tk.StringVar(value=active_profile)
-        self._profile_combo = ttk.Combobox(
-            main_frame,
-            textvariable=self._profile_var,
-            values=("LM Studio", "Ollama", "Custom"),
-            state="readonly",
-            width=45,
-        )
-        self._profile_combo.grid(row=row, column=1, columnspan=2, sticky="ew", pady=4, padx=(8, 0))
+        # Mirrors the profile var so the frequent Ollama checks avoid a Tcl read.
+        self._ollama_selected = active_profile == "Ollama"
+        self._profile_var.trace_add("write", self._on_profile_var_write)
+        self._profile_combo = combo_row(self._profile_var, ("LM Studio", "Ollama", "Custom"), "readonly")
         self._profile_combo.bind("<<ComboboxSelected>>", self._on_profile_changed)
 
         row += 1
         ttk.Label(main_frame, text="Base URL:").grid(row=row, column=0, sticky="w", pady=4)
         self._base_url_var = tk.StringVar(value=settings["base_url"])
-        self._base_url_combo = ttk.Combobox(
-            main_frame,
-            textvariable=self._base_url_var,
-            values=("http://localhost:1234/v1", "http://localhost:11434/v1"),
-            state="normal",
-            width=45,
+        self._base_url_combo = combo_row(
+            self._base_url_var, ("http://localhost:1234/v1", "http://localhost:11434/v1")
         )
-        self._base_url_combo.grid(row=row, column=1, columnspan=2, sticky="ew", pady=4, padx=(8, 0))
 
         row += 1
         ttk.Label(main_frame, text="Model ID:").grid(row=row, column=0, sticky="w", pady=4)
         self._model_var = tk.StringVar(value=settings["model"])
-        model_presets = ()
-        if isinstance(profiles, dict) and isinstance(profiles.get(active_profile), dict):
-            presets = profiles[active_profile].get("model_presets", [])
-            if isinstance(presets, list):
-                model_presets = tuple(str(x) for x in presets if x)
-        self._model_combo = ttk.Combobox(
-            main_frame,
-            textvariable=self._model_var,
-            values=model_presets,
-            state="normal",
-            width=45,
-        )
-        self._model_combo.grid(row=row, column=1, columnspan=2, sticky="ew", pady=4, padx=(8, 0))
+        self._model_presets = self._profile_presets(active_profile)
+        self._model_combo_values = self._model_presets[-self._MAX_COMBO_ENTRIES:]
+        self._model_combo = combo_row(self._model_var, self._model_combo_values)
+        self._model_combo.bind("<KeyRelease>", self._filter_model_presets)
 
         row += 1
         self._model_status_var = tk.StringVar(value="")
@@ -115,47 +122,31 @@ class SettingsWindow:
         row += 1
         self._download_percent_var = tk.StringVar(value="")
         self._download_progress_var = tk.IntVar(value=0)
+        # Bar + percent share one container, so showing/hiding is a single grid toggle.
+        self._progress_frame = ttk.Frame(main_frame)
+        self._progress_frame.grid(row=row, column=1, columnspan=2, sticky="ew", pady=4, padx=(8, 0))
+        self._download_progress_label = ttk.Label(self._progress_frame, textvariable=self._download_percent_var)
+        self._download_progress_label.pack(side="right")
         self._download_progress = ttk.Progressbar(
-            main_frame,
+            self._progress_frame,
             orient="horizontal",
             mode="determinate",
             maximum=100,
             variable=self._download_progress_var,
             length=260,
         )
-        self._download_progress.grid(row=row, column=1, sticky="ew", pady=4, padx=(8, 4))
-        self._download_progress_label = ttk.Label(main_frame, textvariable=self._download_percent_var)
-        self._download_progress_label.grid(row=row, column=2, sticky="e", pady=4)
-        self._download_progress.grid_remove()
-        self._download_progress_label.grid_remove()
+        self._download_progress.pack(side="left", fill="x", expand=True, padx=(0, 4))
+        self._progress_frame.grid_remove()
 
         row += 1
         ttk.Label(main_frame, text="Source language:").grid(row=row, column=0, sticky="w", pady=4)
         self._source_lang_var = tk.StringVar(value=settings["source_lang"])
-        self._source_lang_combo = ttk.Combobox(
-            main_frame,
-            textvariable=self._source_lang_var,
-            values=("English", "Russian"),
-            state="normal",
-            width=45,
-        )
-        self._source_lang_combo.grid(
-            row=row, column=1, columnspan=2, sticky="ew", pady=4, padx=(8, 0)
-        )
+        self._source_lang_combo = combo_row(self._source_lang_var, ("English", "Russian"))
 
         row += 1
         ttk.Label(main_frame, text="Target language:").grid(row=row, column=0, sticky="w", pady=4)
         self._target_lang_var = tk.StringVar(value=settings["target_lang"])
-        self._target_lang_combo = ttk.Combobox(
-            main_frame,
-            textvariable=self._target_lang_var,
-            values=("English", "Russian"),
-            state="normal",
-            width=45,
-        )
-        self._target_lang_combo.grid(
-            row=row, column=1, columnspan=2, sticky="ew", pady=4, padx=(8, 0)
-        )
+        self._target_lang_combo = combo_row(self._target_lang_var, ("English", "Russian"))
 
         row += 1
         ttk.Label(main_frame, text="Hotkey:").grid(row=row, column=0, sticky="w", pady=4)
@@ -192,12 +183,44 @@ class SettingsWindow:
         self._save_btn.pack(side="left", padx=4)
         self._cancel_btn = ttk.Button(btn_frame, text="Cancel", command=self._handle_close)
         self._cancel_btn.pack(side="left", padx=4)
+        # Non-blocking save confirmation (cleared after a few seconds).
+        self._save_status_var = tk.StringVar(value="")
+        ttk.Label(btn_frame, textvariable=self._save_status_var, width=16).pack(side="left", padx=(8, 4))
+        self._save_status_job = None
+
+        # Widgets disabled during a download, with their enabled state.
+        self._toggle_widgets = (
+            (self._profile_combo, "readonly"),
+            (self._base_url_combo, "normal"),
+            (self._model_combo, "normal"),
+            (self._source_lang_combo, "normal"),
+            (self._target_lang_combo, "normal"),
+            (self._record_btn, "normal"),
+            (self._backward_record_btn, "normal"),
+            (self._save_btn, "normal"),
+        )
+        self._controls_enabled: bool | None = None
+
+        # Model checks (and their Ollama probe) wait until the window is first
+        # mapped; the app usually starts hidden in the tray.
+        self._checks_enabled = False
+        self.root.bind("<Map>", self._on_first_map, add="+")
 
         # Apply profile values once at startup (ensures vars match selected profile)
         self._apply_profile_to_fields()
 
         # Re-check model status when model text changes
-        self._model_var.trace_add("write", lambda *_: self._schedule_model_check())
+        self._model_var.trace_add("write", self._on_model_var_write)
+
+    def _on_first_map(self, event) -> None:
+        if event.widget is not self.root or self._checks_enabled:
+            return
+        self._checks_enabled = True
+        self._schedule_model_check(force=True)
+
+    def _on_model_var_write(self, *_) -> None:
+        if not self._suppress_traces:
+            self._schedule_model_check()
 
     # ------------------------------------------------------------------
     # Hotkey recording
@@ -246,65 +269,67 @@ class SettingsWindow:
         59: "f1", 60: "f2", 61: "f3", 62: "f4", 63: "f5", 64: "f6",
         65: "f7", 66: "f8", 67: "f9", 68: "f10", 87: "f11", 88: "f12",
     }
+    # Same map as a dense tuple indexed by scan code, for the per-event lookup.
+    _SC_QWERTY_NAMES: tuple[str | None, ...] = tuple(map(_SC_TO_QWERTY.get, range(max(_SC_TO_QWERTY) + 1)))
 
     def _record_hotkey_thread(self, target_var: tk.StringVar, target_btn: ttk.Button) -> None:
         """Record a physical hotkey combo and store it as a QWERTY name string."""
+        import keyboard  # only needed while recording; installs OS hooks on import
+
         captured: dict[int, str] = {}
         pressed: set[int] = set()
-        last_event_t = time.time()
-        start_t = time.time()
+        # Set 250 ms after a captured chord is fully released; a new key-down
+        # cancels the countdown. The 6 s cap below still bounds the wait.
+        done = threading.Event()
+        settle: threading.Timer | None = None
+        sc_names = self._SC_QWERTY_NAMES
+        key_down, key_up = keyboard.KEY_DOWN, keyboard.KEY_UP
 
         def on_event(event: keyboard.KeyboardEvent) -> None:
-            nonlocal last_event_t
+            nonlocal settle
             try:
-                last_event_t = time.time()
-                sc = int(getattr(event, "scan_code", 0) or 0)
-                if event.event_type == keyboard.KEY_DOWN:
+                sc = event.scan_code or 0
+                event_type = event.event_type
+                if event_type == key_down:
+                    if settle is not None:
+                        settle.cancel()
+                        settle = None
                     pressed.add(sc)
                     if sc not in captured:
-                        qwerty_name = self._SC_TO_QWERTY.get(sc)
+                        qwerty_name = sc_names[sc] if sc < len(sc_names) else None
                         if qwerty_name:
                             captured[sc] = qwerty_name
                         else:
-                            name = getattr(event, "name", "") or ""
+                            name = event.name
                             if name:
                                 captured[sc] = name.lower()
-                elif event.event_type == keyboard.KEY_UP:
+                elif event_type == key_up:
                     pressed.discard(sc)
+                    if captured and not pressed and settle is None:
+                        settle = threading.Timer(0.25, done.set)
+                        settle.daemon = True
+                        settle.start()
             except Exception:
                 pass
 
         hook = keyboard.hook(on_event, suppress=False)
         try:
-            while True:
-                if captured and not pressed and (time.time() - last_event_t) > 0.25:
-                    break
-                if (time.time() - start_t) > 6.0:
-                    break
-                time.sleep(0.01)
+            done.wait(6.0)
         finally:
             try:
                 keyboard.unhook(hook)
             except Exception:
                 pass
+            if settle is not None:
+                settle.cancel()
 
         _mod_priority = {"ctrl": 0, "alt": 1, "shift": 2, "windows": 3}
 
-        def sort_key(sc: int) -> tuple[int, int]:
-            name = captured.get(sc, "")
-            return (_mod_priority.get(name, 10), sc)
-
-        ordered = sorted(captured.keys(), key=sort_key)
-        parts = [captured[sc] for sc in ordered]
-        seen: set[str] = set()
-        deduped: list[str] = []
-        for p in parts:
-            if p not in seen:
-                seen.add(p)
-                deduped.append(p)
-
-        display = "+".join(deduped) if deduped else ""
-        self.root.after(0, self._finish_recording, display, target_var, target_btn)
+        # Modifiers first (in _mod_priority order), then by scan code; drop
+        # duplicate names such as left/right shift.
+        ordered = sorted((_mod_priority.get(name, 10), sc, name) for sc, name in captured.items())
+        display = "+".join(dict.fromkeys(name for _, _, name in ordered))
+        self.root.after_idle(self._finish_recording, display, target_var, target_btn)
 
     def _finish_recording(self, display: str, target_var: tk.StringVar, target_btn: ttk.Button) -> None:
         self._recording_hotkey = False
@@ -321,42 +346,89 @@ class SettingsWindow:
         self._schedule_model_check()
 
     def _apply_profile_to_fields(self) -> None:
-        settings = load_settings()
-        profiles = settings.get("profiles", {})
+        profiles = self._settings.get("profiles", {})
         profile = self._profile_var.get() or "Custom"
         if not isinstance(profiles, dict) or not isinstance(profiles.get(profile), dict):
             return
 
         p = profiles[profile]
-        self._base_url_var.set(str(p.get("base_url", "")))
-        self._model_var.set(str(p.get("model", "")))
+        self._suppress_traces = True
+        try:
+            self._base_url_var.set(str(p.get("base_url", "")))
+            self._model_var.set(str(p.get("model", "")))
+        finally:
+            self._suppress_traces = False
 
-        presets = p.get("model_presets", [])
-        if not isinstance(presets, list):
-            presets = []
-        self._model_combo.configure(values=tuple(str(x) for x in presets if x))
+        self._model_presets = self._profile_presets(profile)
+        self._set_model_combo_values(self._model_presets[-self._MAX_COMBO_ENTRIES:])
         self._schedule_model_check()
 
+    # Dropdown shows at most this many presets (the newest); typing filters the rest.
+    _MAX_COMBO_ENTRIES = 50
+
+    def _filter_model_presets(self, _event=None) -> None:
+        needle = self._model_var.get().strip().lower()
+        if needle:
+            matches = tuple(p for p in self._model_presets if needle in p.lower())
+        else:
+            matches = self._model_presets
+        self._set_model_combo_values(matches[-self._MAX_COMBO_ENTRIES:])
+
+    def _set_model_combo_values(self, values: tuple[str, ...]) -> None:
+        if values != self._model_combo_values:
+            self._model_combo_values = values
+            self._model_combo.configure(values=values)
+
+    def _profile_presets(self, profile: str) -> tuple[str, ...]:
+        cached = self._presets_cache.get(profile)
+        if cached is not None:
+            return cached
+        presets = ()
+        profiles = self._settings.get("profiles", {})
+        if isinstance(profiles, dict) and isinstance(profiles.get(profile), dict):
+            raw = profiles[profile].get("model_presets", [])
+            if isinstance(raw, list):
+                presets = tuple(str(x) for x in raw if x)
+        self._presets_cache[profile] = presets
+        return presets
+
+    def _on_profile_var_write(self, *_) -> None:
+        self._ollama_selected = self._profile_var.get() == "Ollama"
+
     def _is_ollama_profile_selected(self) -> bool:
-        return (self._profile_var.get() or "") == "Ollama"
+        return self._ollama_selected
 
-    def _schedule_model_check(self) -> None:
-        if self._download_in_progress:
-            return
-        if self._model_check_job is not None:
-            try:
-                self.root.after_cancel(self._model_check_job)
-            except Exception:
-                pass
-            self._model_check_job = None
+    _MODEL_CHECK_DELAY_MS = 700
 
-        self._model_check_job = self.root.after(400, self._start_model_check_thread)
+    def _schedule_model_check(self, force: bool = False) -> None:
+        if self._download_in_progress or not self._checks_enabled:
+            return
+        # Stripped, so whitespace-only edits do not trigger another check.
+        key = (self._profile_var.get(), self._base_url_var.get().strip(), self._model_var.get().strip())
+        if not force and key == self._model_check_key:
+            return
+        previous, self._model_check_key = self._model_check_key, key
+        if not self._is_ollama_profile_selected():
+            # Nothing to check; just clear the Ollama status once when leaving it.
+            if previous is None or previous[0] == "Ollama":
+                self._clear_model_status()
+            return
+        self._model_check_due = time.monotonic() + self._MODEL_CHECK_DELAY_MS / 1000
+        if self._model_check_job is None:
+            self._model_check_job = self.root.after(self._MODEL_CHECK_DELAY_MS, self._on_model_check_timer)
+
+    def _on_model_check_timer(self) -> None:
+        remaining_ms = int((self._model_check_due - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            self._model_check_job = self.root.after(remaining_ms, self._on_model_check_timer)
+            return
+        self._start_model_check_thread()
 
     def _start_model_check_thread(self) -> None:
         self._model_check_job = None
+        self._check_seq += 1
         if not self._is_ollama_profile_selected():
-            self._model_status_var.set("")
-            self._download_btn.configure(state="disabled")
+            self._clear_model_status()
             return
 
         base_url = self._base_url_var.get().strip()
@@ -366,56 +438,70 @@ class SettingsWindow:
             self._download_btn.configure(state="disabled")
             return
 
-        def worker() -> None:
-            installed = False
+        request = (self._check_seq, base_url, model)
+        while True:
             try:
-                models = list_models(base_url)
-                installed = model in models
+                self._check_queue.put_nowait(request)
+                break
+            except queue.Full:
+                try:
+                    self._check_queue.get_nowait()  # drop the superseded request
+                except queue.Empty:
+                    pass
+        if self._check_thread is None:
+            self._check_thread = threading.Thread(target=self._model_check_worker, daemon=True)
+            self._check_thread.start()
+
+    def _model_check_worker(self) -> None:
+        while True:
+            seq, base_url, model = self._check_queue.get()
+            try:
+                installed = model in list_models(base_url)
             except Exception:
                 installed = False
-            self.root.after(0, self._apply_model_status, installed)
-
-        threading.Thread(target=worker, daemon=True).start()
+            self.root.after_idle(self._apply_model_status, installed, seq)
 
-    def _apply_model_status(self, installed: bool) -> None:
+    def _apply_model_status(self, installed: bool, seq: int) -> None:
+        if seq != self._check_seq:
+            return  # a newer check has been started since
         if not self._is_ollama_profile_selected():
-            self._model_status_var.set("")
-            self._download_btn.configure(state="disabled")
-            self._unload_btn.grid_remove()
+            self._clear_model_status()
             return
-        # On Ollama profile: show unload button
-        self._unload_btn.grid()
-        self._unload_btn.configure(state=("disabled" if self._download_in_progress else "normal"))
+        # On Ollama profile: show unload button. Repeated checks usually yield the
+        # same result, so only widgets whose state differs are touched.
+        if not self._unload_btn.winfo_manager():
+            self._unload_btn.grid()
+        self._set_widget_state(self._unload_btn, "disabled" if self._download_in_progress else "normal")
         if installed:
-            self._model_status_var.set("Installed")
-            self._download_btn.configure(state="disabled")
+            status, download_state = "Installed", "disabled"
         else:
-            self._model_status_var.set("Missing")
             # Enable only if we have a model name
-            self._download_btn.configure(
-                state=("normal" if self._model_var.get().strip() else "disabled")
-            )
+            status = "Missing"
+            download_state = "normal" if self._model_var.get().strip() else "disabled"
+        if self._model_status_var.get() != status:
+            self._model_status_var.set(status)
+        self._set_widget_state(self._download_btn, download_state)
+
+    @staticmethod
+    def _set_widget_state(widget, state: str) -> None:
+        if str(widget.cget("state")) != state:
+            widget.configure(state=state)
+
+    def _clear_model_status(self) -> None:
+        self._check_seq += 1  # drop any result still in flight
+        self._model_status_var.set("")
+        self._download_btn.configure(state="disabled")
+        self._unload_btn.grid_remove()
 
     def _set_controls_enabled(self, enabled: bool) -> None:
+        if enabled == self._controls_enabled:
+            return  # progress ticks during a download re-request the same state
+        self._controls_enabled = enabled
+        for widget, on_state in self._toggle_widgets:
+            widget.configure(state=(on_state if enabled else "disabled"))
         if enabled:
-            self._profile_combo.configure(state="readonly")
-            self._base_url_combo.configure(state="normal")
-            self._model_combo.configure(state="normal")
-            self._source_lang_combo.configure(state="normal")
-            self._target_lang_combo.configure(state="normal")
-            self._record_btn.configure(state="normal")
-            self._backward_record_btn.configure(state="normal")
-            self._save_btn.configure(state="normal")
             self._unload_btn.configure(state=("normal" if self._is_ollama_profile_selected() else "disabled"))
         else:
-            self._profile_combo.configure(state="disabled")
-            self._base_url_combo.configure(state="disabled")
-            self._model_combo.configure(state="disabled")
-            self._source_lang_combo.configure(state="disabled")
-            self._target_lang_combo.configure(state="disabled")
-            self._record_btn.configure(state="disabled")
-            self._backward_record_btn.configure(state="disabled")
-            self._save_btn.configure(state="disabled")
             self._unload_btn.configure(state="disabled")
 
     def _on_download_clicked(self) -> None:
@@ -450,26 +536,52 @@ class SettingsWindow:
         self._on_unload_models = cb
 
     def set_download_progress_threadsafe(self, in_progress: bool, status: str, percent: int | None) -> None:
-        self.root.after(0, self._set_download_progress, in_progress, status, percent)
+        # Newest-wins, flushed at most every 50 ms (~20 Hz); the terminal
+        # (not in progress) event is flushed on the next idle instead.
+        with self._progress_lock:
+            self._pending_progress = (in_progress, status, percent)
+            if self._progress_scheduled and in_progress:
+                return
+            self._progress_scheduled = True
+        if in_progress:
+            self.root.after(50, self._flush_download_progress)
+        else:
+            self.root.after_idle(self._flush_download_progress)
+
+    def _flush_download_progress(self) -> None:
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, None
+            self._progress_scheduled = False
+        if pending is not None:
+            self._set_download_progress(*pending)
 
     def _set_download_progress(self, in_progress: bool, status: str, percent: int | None) -> None:
+        # Only touch widgets whose state actually changes; progress ticks arrive in bursts.
         if in_progress:
             self._download_in_progress = True
             self._set_controls_enabled(False)
             self._download_btn.configure(state="disabled")
-            self._model_status_var.set(status)
-            self._download_progress.grid()
-            self._download_progress_label.grid()
+            if status != self._model_status_var.get():
+                self._model_status_var.set(status)
+            self._show_download_progress(True)
 
             if percent is None:
-                self._download_percent_var.set("")
-                self._download_progress.configure(mode="indeterminate")
-                self._download_progress.start(10)
+                if self._progress_mode != "indeterminate":
+                    self._progress_mode = "indeterminate"
+                    self._progress_percent = None
+                    self._download_percent_var.set("")
+                    self._download_progress.configure(mode="indeterminate")
+                    self._download_progress.start(10)
             else:
-                self._download_progress.stop()
-                self._download_progress.configure(mode="determinate")
-                self._download_progress_var.set(int(percent))
-                self._download_percent_var.set(f"{int(percent)}%")
+                if self._progress_mode != "determinate":
+                    self._progress_mode = "determinate"
+                    self._download_progress.stop()
+                    self._download_progress.configure(mode="determinate")
+                percent = int(percent)
+                if percent != self._progress_percent:
+                    self._progress_percent = percent
+                    self._download_progress_var.set(percent)
+                    self._download_percent_var.set(f"{percent}%")
         else:
             # Done or failed
             self._download_in_progress = False
@@ -477,24 +589,58 @@ class SettingsWindow:
                 self._download_progress.stop()
             except Exception:
                 pass
-            self._download_progress.grid_remove()
-            self._download_progress_label.grid_remove()
+            self._progress_mode = None
+            self._progress_percent = None
+            self._show_download_progress(False)
             self._set_controls_enabled(True)
             # After download attempt, re-check installed status
-            self._schedule_model_check()
+            self._schedule_model_check(force=True)
+
+    def _show_download_progress(self, visible: bool) -> None:
+        if visible == self._progress_visible:
+            return
+        self._progress_visible = visible
+        if visible:
+            self._progress_frame.grid()
+        else:
+            self._progress_frame.grid_remove()
 
     def _save(self) -> None:
-        loaded = load_settings()
-        profiles = loaded.get("profiles", {})
-        if not isinstance(profiles, dict):
-            profiles = {}
+        # Each Tk variable is read and stripped exactly once.
+        active_profile, base_url, model, hotkey, backward_hotkey, source_lang, target_lang = (
+            var.get().strip()
+            for var in (
+                self._profile_var,
+                self._base_url_var,
+                self._model_var,
+                self._hotkey_var,
+                self._backward_hotkey_var,
+                self._source_lang_var,
+                self._target_lang_var,
+            )
+        )
+        active_profile = active_profile or "Custom"
+
+        if not base_url:
+            messagebox.showwarning("Validation", "Base URL cannot be empty.")
+            return
+        if not model:
+            messagebox.showwarning("Validation", "Model ID cannot be empty.")
+            return
 
-        active_profile = (self._profile_var.get() or "Custom").strip() or "Custom"
-        if active_profile not in profiles or not isinstance(profiles.get(active_profile), dict):
-            profiles[active_profile] = {"base_url": "", "model": "", "model_presets": []}
+        loaded = load_settings()
 
-        base_url = self._base_url_var.get().strip()
-        model = self._model_var.get().strip()
+        # Update active profile values + per-profile model presets. load_settings()
+        # guarantees a dict of profile dicts with list presets; copies keep `loaded` intact.
+        profiles = dict(loaded["profiles"])
+        profile_obj = dict(profiles.get(active_profile) or {})
+        profile_obj["base_url"] = base_url
+        profile_obj["model"] = model
+        # dict.fromkeys: ordered, O(1) dedup; the saved model is appended if new.
+        profile_obj["model_presets"] = list(
+            dict.fromkeys([*(profile_obj.get("model_presets") or []), model])
+        )
+        profiles[active_profile] = profile_obj
 
         settings = {
             # flattened (derived) values
@@ -503,38 +649,33 @@ class SettingsWindow:
             # profile schema
             "active_profile": active_profile,
             "profiles": profiles,
-            "hotkey": self._hotkey_var.get().strip(),
-            "backward_hotkey": self._backward_hotkey_var.get().strip(),
+            "hotkey": hotkey,
+            "backward_hotkey": backward_hotkey,
             # rest
-            "source_lang": self._source_lang_var.get().strip(),
-            "target_lang": self._target_lang_var.get().strip(),
+            "source_lang": source_lang,
+            "target_lang": target_lang,
         }
 
-        if not settings["base_url"]:
-            messagebox.showwarning("Validation", "Base URL cannot be empty.")
-            return
-        if not settings["model"]:
-            messagebox.showwarning("Validation", "Model ID cannot be empty.")
-            return
-
-        # Update active profile values + per-profile model presets
-        profile_obj = settings["profiles"][active_profile]
-        profile_obj["base_url"] = base_url
-        profile_obj["model"] = model
-        presets = profile_obj.get("model_presets", [])
-        if not isinstance(presets, list):
-            presets = []
-        if model and model not in presets:
-            presets.append(model)
-        profile_obj["model_presets"] = presets
-
-        save_settings(settings)
+        if settings != loaded:  # nothing to write when the form matches the file
+            save_settings(settings)
+        self._settings = settings
+        self._presets_cache.clear()
 
         if self._on_settings_saved:
             self._on_settings_saved(settings)
 
-        messagebox.showinfo("Saved", "Settings saved successfully.")
-        self._schedule_model_check()
+        self._show_save_status("Settings saved.")
+        self._schedule_model_check(force=True)
+
+    def _show_save_status(self, text: str) -> None:
+        if self._save_status_job is not None:
+            self.root.after_cancel(self._save_status_job)
+        self._save_status_var.set(text)
+        self._save_status_job = self.root.after(2500, self._clear_save_status)
+
+    def _clear_save_status(self) -> None:
+        self._save_status_job = None
+        self._save_status_var.set("")
 
     def _handle_close(self) -> None:
         """Hide the window instead of destroying it (minimize to tray)."""
@@ -554,12 +695,18 @@ class SettingsWindow:
 
     def reload_fields(self) -> None:
         """Re-read settings.json and update entry fields."""
-        settings = load_settings()
-        self._profile_var.set(settings.get("active_profile", "Custom"))
-        self._base_url_var.set(settings["base_url"])
-        self._model_var.set(settings["model"])
-        self._source_lang_var.set(settings["source_lang"])
-        self._target_lang_var.set(settings["target_lang"])
-        self._hotkey_var.set(settings.get("hotkey", "ctrl+alt+t"))
-        self._backward_hotkey_var.set(settings.get("backward_hotkey", "ctrl+alt+y"))
+        self._settings = settings = load_settings()
+        self._presets_cache.clear()
+        self._suppress_traces = True
+        try:
+            self._profile_var.set(settings.get("active_profile", "Custom"))
+            self._base_url_var.set(settings["base_url"])
+            self._model_var.set(settings["model"])
+            self._source_lang_var.set(settings["source_lang"])
+            self._target_lang_var.set(settings["target_lang"])
+            self._hotkey_var.set(settings.get("hotkey", "ctrl+alt+t"))
+            self._backward_hotkey_var.set(settings.get("backward_hotkey", "ctrl+alt+y"))
+        finally:
+            self._suppress_traces = False
         self._apply_profile_to_fields()
+        self._schedule_model_check()